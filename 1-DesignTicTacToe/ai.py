@@ -0,0 +1,371 @@
+"""
+Move suggestion for Tic-Tac-Toe on NxN boards
+
+This module includes:
+- Searcher class: negamax with alpha-beta pruning over one board size
+- solve() and best_move() helpers on top of Board and Game
+
+The searcher keeps its own make/unmake position (cells plus per-line X/O
+counts) instead of copying get_board_state() per node. Positions are
+keyed in a transposition table by Zobrist hashes maintained
+incrementally for all 8 board symmetries; the smallest of the 8 is the
+canonical key, so rotated and mirrored positions share an entry.
+
+Move ordering: immediate wins, then blocks, then the transposition-table
+move, then cells on the most lines (centre and diagonals first).
+
+Searchers are cached per board size, so after the first call the 3x3
+game is answered straight from the table. Larger boards are searched
+with iterative deepening until a time budget runs out, scoring the
+frontier by open lines.
+"""
+
+import random
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from solution import Game
+
+
+WIN_SCORE = 1_000_000
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class SearchResult(NamedTuple):
+    """Outcome of a search from the side to move's point of view"""
+    move: Optional[Tuple[int, int]]
+    score: int  # +1 win, 0 draw, -1 loss when exact; heuristic otherwise
+    exact: bool  # True if the game-theoretic value was proven
+    depth: int  # deepest completed iteration
+    nodes: int
+
+
+class _Timeout(Exception):
+    """Raised inside the search when the time budget is spent"""
+
+
+def _symmetries(size: int) -> List[List[int]]:
+    """The 8 rotations/reflections of the board as cell permutations"""
+    last = size - 1
+    transforms = [
+        lambda r, c: (r, c),
+        lambda r, c: (c, last - r),
+        lambda r, c: (last - r, last - c),
+        lambda r, c: (last - c, r),
+        lambda r, c: (r, last - c),
+        lambda r, c: (last - r, c),
+        lambda r, c: (c, r),
+        lambda r, c: (last - c, last - r),
+    ]
+    perms = []
+    for transform in transforms:
+        perm = []
+        for cell in range(size * size):
+            r, c = transform(*divmod(cell, size))
+            perm.append(r * size + c)
+        perms.append(perm)
+    return perms
+
+
+class Searcher:
+    """Negamax alpha-beta search with a symmetry-aware transposition table"""
+
+    def __init__(self, size: int, max_table_entries: int = 2_000_000):
+        """
+        Precompute lines, symmetries and Zobrist keys for a board size
+
+        Args:
+            size: Size of the board
+            max_table_entries: Clear the transposition table beyond this size
+        """
+        self.size = size
+        self.num_cells = size * size
+        self.max_table_entries = max_table_entries
+
+        lines = [[r * size + c for c in range(size)] for r in range(size)]
+        lines += [[r * size + c for r in range(size)] for c in range(size)]
+        lines.append([i * size + i for i in range(size)])
+        lines.append([i * size + size - 1 - i for i in range(size)])
+        self.cell_lines = [[] for _ in range(self.num_cells)]
+        for index, line in enumerate(lines):
+            for cell in line:
+                self.cell_lines[cell].append(index)
+        self.num_lines = len(lines)
+
+        self.symmetries = _symmetries(size)
+        self.inverses = []
+        for perm in self.symmetries:
+            inverse = [0] * self.num_cells
+            for cell, mapped in enumerate(perm):
+                inverse[mapped] = cell
+            self.inverses.append(inverse)
+
+        rng = random.Random(size)
+        self.zobrist = [(0, rng.getrandbits(64), rng.getrandbits(64))
+                        for _ in range(self.num_cells)]
+
+        # Cells on more lines first, then closer to the centre
+        centre = (size - 1) / 2
+        self.static_order = sorted(
+            range(self.num_cells),
+            key=lambda cell: (-len(self.cell_lines[cell]),
+                              abs(cell // size - centre) + abs(cell % size - centre)))
+
+        self.table: Dict[int, Tuple[int, int, int, Optional[int]]] = {}
+        self.nodes = 0
+        self.deadline = None
+
+    def search(self, state: List[List[str]], symbol: str,
+               time_budget: Optional[float] = None) -> SearchResult:
+        """
+        Find the best move for symbol in a position
+
+        Args:
+            state: Board state as returned by get_board_state()
+            symbol: 'X' or 'O', the side to move
+            time_budget: Seconds to search (default: until solved)
+
+        Returns:
+            SearchResult for the side to move
+        """
+        player = 1 if symbol == 'X' else 2
+        self._load(state)
+        self.nodes = 0
+        empties = self.num_cells - self.moves_count
+        if empties == 0:
+            return SearchResult(None, 0, True, 0, 0)
+
+        # Take an immediate win without searching
+        for cell in self._empty_cells():
+            if self._completes_line(cell, player):
+                return SearchResult(divmod(cell, self.size), 1, True, 1, 0)
+
+        if len(self.table) > self.max_table_entries:
+            self.table.clear()
+        self.deadline = None if time_budget is None else time.perf_counter() + time_budget
+        best = SearchResult(divmod(self._empty_cells()[0], self.size), 0, False, 0, 0)
+        for depth in range(1, empties + 1):
+            try:
+                value, cell = self._negamax(depth, -WIN_SCORE - 1, WIN_SCORE + 1, player)
+            except _Timeout:
+                self._load(state)
+                break
+            exact = depth == empties or abs(value) == WIN_SCORE
+            score = (value // WIN_SCORE) if abs(value) == WIN_SCORE else (0 if exact else value)
+            best = SearchResult(divmod(cell, self.size), score, exact, depth, self.nodes)
+            if exact:
+                break
+        return best
+
+    def _load(self, state: List[List[str]]):
+        """Set up the make/unmake position from a board state"""
+        self.cells = [0] * self.num_cells
+        self.x_counts = [0] * self.num_lines
+        self.o_counts = [0] * self.num_lines
+        self.hashes = [0] * 8
+        self.score = 0
+        self.moves_count = 0
+        for r, row in enumerate(state):
+            for c, value in enumerate(row):
+                if value:
+                    self._play(r * self.size + c, 1 if value == 'X' else 2)
+
+    def _empty_cells(self) -> List[int]:
+        """Empty cells in static order"""
+        cells = self.cells
+        return [cell for cell in self.static_order if not cells[cell]]
+
+    def _line_value(self, line: int) -> int:
+        """Open-line heuristic from X's point of view"""
+        x, o = self.x_counts[line], self.o_counts[line]
+        if o == 0:
+            return x * x
+        if x == 0:
+            return -o * o
+        return 0
+
+    def _completes_line(self, cell: int, player: int) -> bool:
+        """Check whether playing cell wins for player"""
+        mine = self.x_counts if player == 1 else self.o_counts
+        target = self.size - 1
+        return any(mine[line] == target and
+                   (self.o_counts if player == 1 else self.x_counts)[line] == 0
+                   for line in self.cell_lines[cell])
+
+    def _play(self, cell: int, player: int) -> bool:
+        """Place a stone, update counts/hashes/score; return True if it wins"""
+        self.cells[cell] = player
+        self.moves_count += 1
+        counts = self.x_counts if player == 1 else self.o_counts
+        won = False
+        for line in self.cell_lines[cell]:
+            self.score -= self._line_value(line)
+            counts[line] += 1
+            self.score += self._line_value(line)
+            if counts[line] == self.size:
+                won = True
+        hashes = self.hashes
+        for t, perm in enumerate(self.symmetries):
+            hashes[t] ^= self.zobrist[perm[cell]][player]
+        return won
+
+    def _undo(self, cell: int, player: int):
+        """Remove a stone placed by _play"""
+        self.cells[cell] = 0
+        self.moves_count -= 1
+        counts = self.x_counts if player == 1 else self.o_counts
+        for line in self.cell_lines[cell]:
+            self.score -= self._line_value(line)
+            counts[line] -= 1
+            self.score += self._line_value(line)
+        hashes = self.hashes
+        for t, perm in enumerate(self.symmetries):
+            hashes[t] ^= self.zobrist[perm[cell]][player]
+
+    def _ordered_moves(self, player: int, tt_move: Optional[int]) -> List[int]:
+        """Empty cells: wins, blocks, table move, then static order"""
+        empties = self._empty_cells()
+        wins = [cell for cell in empties if self._completes_line(cell, player)]
+        if wins:
+            return wins[:1]
+        blocks = [cell for cell in empties if self._completes_line(cell, 3 - player)]
+        front = blocks + ([tt_move] if tt_move is not None and tt_move not in blocks else [])
+        return front + [cell for cell in empties if cell not in front]
+
+    def _negamax(self, depth: int, alpha: int, beta: int, player: int) -> Tuple[int, Optional[int]]:
+        """Return (value for player to move, best cell)"""
+        self.nodes += 1
+        if self.deadline is not None and self.nodes & 1023 == 0 \
+                and time.perf_counter() > self.deadline:
+            raise _Timeout()
+
+        empties = self.num_cells - self.moves_count
+        if empties == 0:
+            return 0, None
+        if depth == 0:
+            return (self.score if player == 1 else -self.score), None
+
+        key = min(self.hashes)
+        sym = self.hashes.index(key)
+        key = key * 3 + player
+        entry = self.table.get(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, value, flag, move = entry
+            if move is not None:
+                tt_move = self.inverses[sym][move]
+            if entry_depth >= min(depth, empties):
+                if flag == EXACT:
+                    return value, tt_move
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value, tt_move
+
+        original_alpha = alpha
+        best_value, best_cell = -WIN_SCORE - 1, None
+        for cell in self._ordered_moves(player, tt_move):
+            if self._play(cell, player):
+                value = WIN_SCORE
+            else:
+                value = -self._negamax(depth - 1, -beta, -alpha, 3 - player)[0]
+            self._undo(cell, player)
+            if value > best_value:
+                best_value, best_cell = value, cell
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                break
+
+        if best_value <= original_alpha:
+            flag = UPPER
+        elif best_value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        # A subtree searched to the end is valid for any future depth
+        stored_depth = depth if depth < empties else self.num_cells
+        self.table[key] = (stored_depth, best_value, flag, self.symmetries[sym][best_cell])
+        return best_value, best_cell
+
+
+_searchers: Dict[int, Searcher] = {}
+
+
+def _searcher_for(size: int) -> Searcher:
+    """Get the cached searcher for a board size"""
+    searcher = _searchers.get(size)
+    if searcher is None:
+        searcher = _searchers[size] = Searcher(size)
+    return searcher
+
+
+def solve(board, symbol: Optional[str] = None,
+          time_budget: Optional[float] = None) -> SearchResult:
+    """
+    Search a board position
+
+    Args:
+        board: Any board backend (Board, BitBoard, CompactBoard)
+        symbol: Side to move (default: inferred, X moves first)
+        time_budget: Seconds to search (default: until solved)
+
+    Returns:
+        SearchResult for the side to move
+    """
+    state = board.get_board_state()
+    if symbol is None:
+        x_count = sum(row.count('X') for row in state)
+        o_count = sum(row.count('O') for row in state)
+        symbol = 'X' if x_count == o_count else 'O'
+    if board.check_winner() is not None:
+        return SearchResult(None, -1, True, 0, 0)
+    return _searcher_for(board.size).search(state, symbol, time_budget)
+
+
+def best_move(game: Game, time_budget: Optional[float] = 1.0) -> Optional[Tuple[int, int]]:
+    """
+    Suggest a move for the player whose turn it is
+
+    Args:
+        game: Game in progress
+        time_budget: Seconds to search (None: until solved)
+
+    Returns:
+        (row, col) or None if the game is over
+    """
+    if game.get_game_status().value != 'IN_PROGRESS':
+        return None
+    return solve(game.board, game.get_current_player().symbol, time_budget).move
+
+
+# Example usage
+if __name__ == "__main__":
+    from solution import Board, GameStatus, Player
+
+    print("=" * 50)
+    print("AI - Solver and Move Suggestion")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    result = solve(Board(3))
+    print(f"3x3 solved in {(time.perf_counter() - start) * 1000:.1f} ms: {result}")
+    start = time.perf_counter()
+    result = solve(Board(3))
+    print(f"3x3 cached in {(time.perf_counter() - start) * 1000:.2f} ms: {result}")
+
+    game = Game(Player("ai1", "X"), Player("ai2", "O"))
+    while game.get_game_status() == GameStatus.IN_PROGRESS:
+        row, col = best_move(game, time_budget=None)
+        game.make_move(game.get_current_player().player_id, row, col)
+    print(f"Perfect play on 3x3: {game.get_game_status().value}")
+
+    board = Board(7)
+    board.make_move(3, 3, 'X')
+    start = time.perf_counter()
+    result = solve(board, time_budget=0.5)
+    print(f"7x7 with 0.5s budget: move={result.move} depth={result.depth} "
+          f"nodes={result.nodes} ({time.perf_counter() - start:.2f}s)")
+    print("\n" + "=" * 50)
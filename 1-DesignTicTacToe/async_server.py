@@ -0,0 +1,308 @@
+"""
+asyncio front end for GameManager
+
+This module includes:
+- AsyncGameManager class exposing GameManager operations as coroutines
+- A line-based TCP server driving an AsyncGameManager
+- A load client that plays many games over concurrent connections
+
+Moves for a game are appended to that game's queue and applied in
+arrival order by a drain callback on the event loop, so one loop serves
+any number of games and connections without threads. Results keep the
+GameManager contract ('SUCCESS', 'NOT_YOUR_TURN', ...).
+
+Protocol (one request per line, one response per line):
+    CREATE <player1_id> <player2_id>      -> <game_id>
+    MOVE <game_id> <player_id> <row> <col> -> SUCCESS | INVALID_MOVE | ...
+    GET <game_id>                          -> <status> <board> | GAME_NOT_FOUND
+    DELETE <game_id>                       -> OK | GAME_NOT_FOUND
+Boards are rows joined by '/', with '.' for empty cells.
+
+Usage:
+    python async_server.py serve --port 8765
+    python async_server.py load --port 8765 --connections 200 --games 50
+    python async_server.py demo
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from solution import Game, GameManager, GameStatus
+
+
+class AsyncGameManager:
+    """Coroutine wrapper around GameManager with per-game move queues"""
+
+    def __init__(self, manager: Optional[GameManager] = None):
+        """
+        Initialize the async game manager
+
+        Args:
+            manager: GameManager to wrap (default: new GameManager)
+        """
+        self.manager = manager if manager is not None else GameManager()
+        # game_id -> pending (player_id, row, col, future) in arrival order
+        self.queues: Dict[str, Deque[Tuple[str, int, int, asyncio.Future]]] = {}
+
+    async def create_game(self, player1_id: str, player2_id: str) -> str:
+        """
+        Create a new game
+
+        Args:
+            player1_id: ID of first player (will be X)
+            player2_id: ID of second player (will be O)
+
+        Returns:
+            Game ID
+        """
+        return self.manager.create_game(player1_id, player2_id)
+
+    async def get_game(self, game_id: str) -> Optional[Game]:
+        """
+        Get a game by ID
+
+        Args:
+            game_id: Game ID
+
+        Returns:
+            Game object or None if not found
+        """
+        return self.manager.get_game(game_id)
+
+    async def make_move(self, game_id: str, player_id: str, row: int, col: int) -> str:
+        """
+        Queue a move and wait for its result
+
+        Args:
+            game_id: Game ID
+            player_id: Player ID
+            row: Row index
+            col: Column index
+
+        Returns:
+            Status message
+        """
+        future = asyncio.get_running_loop().create_future()
+        queue = self.queues.get(game_id)
+        if queue is None:
+            # First pending move for this game: schedule a drain
+            queue = self.queues[game_id] = deque()
+            asyncio.get_running_loop().call_soon(self._drain, game_id)
+        queue.append((player_id, row, col, future))
+        return await future
+
+    async def delete_game(self, game_id: str) -> bool:
+        """
+        Delete a game
+
+        Args:
+            game_id: Game ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        return self.manager.delete_game(game_id)
+
+    def _drain(self, game_id: str):
+        """
+        Apply every queued move for a game in order
+
+        A move that raises fails only its own future; the rest of the
+        queue is still applied.
+        """
+        queue = self.queues.pop(game_id)
+        make_move = self.manager.make_move
+        while queue:
+            player_id, row, col, future = queue.popleft()
+            if future.cancelled():
+                continue
+            try:
+                result = make_move(game_id, player_id, row, col)
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+
+def _format_board(game: Game) -> str:
+    """Render a board as rows joined by '/', '.' for empty"""
+    return '/'.join(''.join(cell or '.' for cell in row) for row in game.get_board_state())
+
+
+async def _handle_line(manager: AsyncGameManager, line: str) -> str:
+    """Execute one protocol request"""
+    parts = line.split()
+    if not parts:
+        return 'ERROR empty request'
+    command, args = parts[0].upper(), parts[1:]
+    try:
+        if command == 'CREATE' and len(args) == 2:
+            return await manager.create_game(args[0], args[1])
+        if command == 'MOVE' and len(args) == 4:
+            return await manager.make_move(args[0], args[1], int(args[2]), int(args[3]))
+        if command == 'GET' and len(args) == 1:
+            game = await manager.get_game(args[0])
+            if game is None:
+                return 'GAME_NOT_FOUND'
+            return f"{game.get_game_status().value} {_format_board(game)}"
+        if command == 'DELETE' and len(args) == 1:
+            return 'OK' if await manager.delete_game(args[0]) else 'GAME_NOT_FOUND'
+    except ValueError:
+        pass
+    return f"ERROR bad request: {line}"
+
+
+async def serve_connection(manager: AsyncGameManager, reader: asyncio.StreamReader,
+                           writer: asyncio.StreamWriter):
+    """
+    Serve one client connection until it closes
+
+    Args:
+        manager: Shared AsyncGameManager
+        reader: Connection reader
+        writer: Connection writer
+    """
+    try:
+        while True:
+            raw = await reader.readline()
+            if not raw:
+                break
+            try:
+                line = raw.decode()
+            except UnicodeDecodeError:
+                response = 'ERROR bad request: invalid UTF-8'
+            else:
+                response = await _handle_line(manager, line.strip())
+            writer.write(response.encode() + b'\n')
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def start_server(manager: AsyncGameManager, host: str, port: int) -> asyncio.AbstractServer:
+    """
+    Start the TCP line-protocol server
+
+    Args:
+        manager: AsyncGameManager to serve
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        Running asyncio server
+    """
+    return await asyncio.start_server(
+        lambda reader, writer: serve_connection(manager, reader, writer), host, port)
+
+
+async def _client_session(host: str, port: int, num_games: int, size: int,
+                          seed: int) -> Tuple[int, float]:
+    """Play num_games random games over one connection"""
+    rnd = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def request(line: str) -> str:
+        writer.write(line.encode() + b'\n')
+        await writer.drain()
+        return (await reader.readline()).decode().strip()
+
+    moves = 0
+    start = time.perf_counter()
+    for g in range(num_games):
+        players = (f"c{seed}g{g}x", f"c{seed}g{g}o")
+        game_id = await request(f"CREATE {players[0]} {players[1]}")
+        cells = [(r, c) for r in range(size) for c in range(size)]
+        rnd.shuffle(cells)
+        for turn, (row, col) in enumerate(cells):
+            result = await request(f"MOVE {game_id} {players[turn % 2]} {row} {col}")
+            moves += 1
+            status = await request(f"GET {game_id}") if result == 'SUCCESS' else ''
+            if not status.startswith(GameStatus.IN_PROGRESS.value):
+                break
+        await request(f"DELETE {game_id}")
+    elapsed = time.perf_counter() - start
+    writer.close()
+    await writer.wait_closed()
+    return moves, elapsed
+
+
+async def run_load(host: str, port: int, connections: int, games: int,
+                   size: int = 3) -> Dict[str, float]:
+    """
+    Drive a server with many concurrent connections
+
+    Args:
+        host: Server host
+        port: Server port
+        connections: Number of concurrent client connections
+        games: Games played sequentially per connection
+        size: Board size the server uses
+
+    Returns:
+        Dict with total moves, wall time and moves per second
+    """
+    start = time.perf_counter()
+    sessions = await asyncio.gather(*(
+        _client_session(host, port, games, size, seed) for seed in range(connections)))
+    elapsed = time.perf_counter() - start
+    total_moves = sum(moves for moves, _ in sessions)
+    return {'moves': total_moves, 'seconds': elapsed, 'moves_per_second': total_moves / elapsed}
+
+
+async def _demo(connections: int, games: int):
+    """Run a server and a load client in one event loop"""
+    manager = AsyncGameManager()
+    server = await start_server(manager, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        # Ordered queue: both moves land, the second one sees X's stone
+        game_id = await manager.create_game("alice", "bob")
+        results = await asyncio.gather(
+            manager.make_move(game_id, "alice", 0, 0),
+            manager.make_move(game_id, "bob", 0, 0),
+            manager.make_move(game_id, "bob", 1, 1),
+        )
+        print(f"Queued moves: {results}")
+
+        stats = await run_load('127.0.0.1', port, connections, games)
+        print(f"{connections} connections x {games} games: "
+              f"{stats['moves']} moves in {stats['seconds']:.2f}s "
+              f"({stats['moves_per_second']:,.0f} moves/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('mode', choices=['serve', 'load', 'demo'])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--connections', type=int, default=100)
+    parser.add_argument('--games', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.mode == 'serve':
+        async def serve():
+            server = await start_server(AsyncGameManager(), args.host, args.port)
+            print(f"Serving on {args.host}:{args.port}")
+            async with server:
+                await server.serve_forever()
+        asyncio.run(serve())
+    elif args.mode == 'load':
+        stats = asyncio.run(run_load(args.host, args.port, args.connections, args.games))
+        print(f"{stats['moves']} moves in {stats['seconds']:.2f}s "
+              f"({stats['moves_per_second']:,.0f} moves/s)")
+    else:
+        asyncio.run(_demo(args.connections, args.games))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+"""
+Benchmark suite for the Board, Game and GameManager hot paths
+
+Benchmarks:
+- board_moves: make_move + check_winner + is_full per move, for every
+  board backend across board sizes
+- create_game: GameManager.create_game throughput (includes uuid4)
+- make_move_latency: GameManager.make_move latency percentiles with
+  10k / 100k / 1M resident games
+- bytes_per_game: traced heap bytes per resident game for each layout
+- churn: waves of short concurrent games created, played and deleted, with and
+  without the GameManager object pool, including GC pause statistics
+
+Results are printed (or written) as JSON. Pass --compare with an older
+result file to flag regressions beyond a threshold; the exit status is 1
+if any metric regressed, so the suite can gate a deploy.
+
+Usage:
+    python benchmarks.py --output bench.json
+    python benchmarks.py --quick --compare bench.json --threshold 0.10
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+from memory_usage import bytes_per_game
+from solution import (Board, BitBoard, CompactBoard, CompactGame, Game, GameManager,
+                      SparseBoard)
+
+
+BACKENDS = {
+    'Board': Board,
+    'BitBoard': BitBoard,
+    'CompactBoard': CompactBoard,
+    'SparseBoard': SparseBoard,
+}
+
+# Metrics where a larger value is better; everything else is lower-is-better
+HIGHER_IS_BETTER = ('per_second',)
+
+
+def _best_of(repeats: int, run: Callable[[], float]) -> float:
+    """Run a timing function several times and keep the fastest result"""
+    gc.collect()
+    return min(run() for _ in range(repeats))
+
+
+def bench_board_moves(sizes: List[int], repeats: int, seed: int) -> Dict[str, Dict[str, float]]:
+    """
+    Time a move plus the win and draw checks for each backend and size
+
+    Every cell of the board is played in a fixed random order.
+
+    Returns:
+        {backend: {size: nanoseconds per move}}
+    """
+    results = {}
+    for name, board_class in BACKENDS.items():
+        results[name] = {}
+        for size in sizes:
+            rnd = random.Random(seed)
+            cells = [(r, c) for r in range(size) for c in range(size)]
+            rnd.shuffle(cells)
+            moves = [(r, c, 'XO'[i % 2]) for i, (r, c) in enumerate(cells)]
+
+            def run() -> float:
+                board = board_class(size)
+                start = time.perf_counter_ns()
+                for row, col, symbol in moves:
+                    board.make_move(row, col, symbol)
+                    board.check_winner()
+                    board.is_full()
+                return (time.perf_counter_ns() - start) / len(moves)
+
+            results[name][str(size)] = round(_best_of(repeats, run), 1)
+    return results
+
+
+def bench_create_game(num_games: int, repeats: int) -> Dict[str, float]:
+    """
+    Time GameManager.create_game, uuid generation included
+
+    Returns:
+        Dict with games per second and nanoseconds per game
+    """
+    def run() -> float:
+        manager = GameManager()
+        start = time.perf_counter_ns()
+        for i in range(num_games):
+            manager.create_game("p1", "p2")
+        return (time.perf_counter_ns() - start) / num_games
+
+    ns = _best_of(repeats, run)
+    return {'ns_per_game': round(ns, 1), 'games_per_second': round(1e9 / ns)}
+
+
+def _percentile(sorted_values: List[int], fraction: float) -> int:
+    """Nearest-rank percentile of an already sorted list"""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def bench_make_move_latency(resident: List[int], samples: int, seed: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measure make_move latency with many games resident
+
+    Each call picks a random game and plays its next legal move. Moves
+    follow a drawn-game order capped at 8 moves, so no call ends a game
+    and every call does real work; samples are capped at 4 per game.
+
+    Returns:
+        {resident games: {p50_ns, p90_ns, p99_ns, p999_ns, moves_per_second}}
+    """
+    results = {}
+    for count in resident:
+        rnd = random.Random(seed)
+        manager = GameManager()
+        game_ids = [manager.create_game(f"x{i}", f"o{i}") for i in range(count)]
+        next_move = [0] * count
+        # X and O alternate; no line is completed within the first 8 moves
+        order = [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2), (2, 1), (2, 0)]
+        num_calls = min(samples, 4 * count)
+        # Pre-draw the calls so only make_move is timed
+        calls = []
+        while len(calls) < num_calls:
+            index = rnd.randrange(count)
+            turn = next_move[index]
+            if turn == len(order):
+                continue
+            next_move[index] += 1
+            calls.append((game_ids[index], f"{'xo'[turn % 2]}{index}", *order[turn]))
+
+        gc.collect()
+        latencies = []
+        make_move = manager.make_move
+        clock = time.perf_counter_ns
+        total_start = clock()
+        for game_id, player_id, row, col in calls:
+            start = clock()
+            make_move(game_id, player_id, row, col)
+            latencies.append(clock() - start)
+        total = clock() - total_start
+        latencies.sort()
+        results[str(count)] = {
+            'p50_ns': _percentile(latencies, 0.50),
+            'p90_ns': _percentile(latencies, 0.90),
+            'p99_ns': _percentile(latencies, 0.99),
+            'p999_ns': _percentile(latencies, 0.999),
+            'moves_per_second': round(num_calls * 1e9 / total),
+        }
+        del manager, game_ids, calls
+    return results
+
+
+def bench_bytes_per_game(num_games: int) -> Dict[str, float]:
+    """
+    Measure heap bytes per resident game (5 moves played) for each layout
+
+    Returns:
+        {layout: bytes per game}
+    """
+    layouts = {
+        'Game+Board': (Board, Game),
+        'Game+BitBoard': (BitBoard, Game),
+        'CompactGame+CompactBoard': (CompactBoard, CompactGame),
+    }
+    return {name: round(bytes_per_game(board, game, num_games, 5))
+            for name, (board, game) in layouts.items()}
+
+
+def bench_churn(num_games: int, resident: int, pool_size: int, seed: int,
+                live: int = 1024) -> Dict[str, float]:
+    """
+    Create, play and delete short games with many other games resident
+
+    Games run in waves of live concurrent games, as on a busy server: a
+    wave is created, its moves are interleaved, then it is deleted. Games
+    hold no reference cycles, so with one game at a time every object is
+    freed by reference counting and the cyclic GC never runs; it is the
+    objects of the games in flight that trigger collections. The resident
+    games make every full collection expensive. GC pauses are measured
+    with gc.callbacks.
+
+    Args:
+        num_games: Short games to churn through
+        resident: Long-lived games kept in the manager meanwhile
+        pool_size: GameManager pool_size (0 = allocate every game)
+        seed: Random seed for the move orders
+        live: Games in flight at once (at most 1024)
+
+    Returns:
+        Dict with games per second and GC collection count, total and max pause
+    """
+    rnd = random.Random(seed)
+    orders = []
+    for _ in range(64):
+        cells = [(r, c) for r in range(3) for c in range(3)]
+        rnd.shuffle(cells)
+        orders.append(cells[:rnd.randrange(5, 10)])
+
+    # Fixed IDs keep uuid4 (identical in both modes) out of the timing
+    game_ids = [f"churn{i}" for i in range(1024)]
+    manager = GameManager(pool_size=pool_size)
+    for i in range(resident):
+        manager.create_game(f"rx{i}", f"ro{i}")
+    pauses = []
+    started = []
+
+    def on_gc(phase: str, info: dict):
+        if phase == 'start':
+            started.append(time.perf_counter_ns())
+        elif started:
+            pauses.append(time.perf_counter_ns() - started.pop())
+
+    players = ("x", "o")
+    gc.collect()
+    gc.callbacks.append(on_gc)
+    try:
+        start = time.perf_counter_ns()
+        for first in range(0, num_games, live):
+            wave = [(manager.create_game(*players, game_ids[i - first]), orders[i & 63])
+                    for i in range(first, min(first + live, num_games))]
+            for turn in range(9):
+                player_id = players[turn & 1]
+                for game_id, order in wave:
+                    if turn < len(order):
+                        manager.make_move(game_id, player_id, *order[turn])
+            for game_id, _ in wave:
+                manager.delete_game(game_id)
+        elapsed = time.perf_counter_ns() - start
+    finally:
+        gc.callbacks.remove(on_gc)
+    return {
+        'games_per_second': round(num_games * 1e9 / elapsed),
+        'gc_collections': len(pauses),
+        'gc_total_ms': round(sum(pauses) / 1e6, 2),
+        'gc_max_pause_ms': round(max(pauses, default=0) / 1e6, 2),
+    }
+
+
+def run_suite(quick: bool = False, seed: int = 0) -> dict:
+    """
+    Run every benchmark
+
+    Args:
+        quick: Use smaller sizes for a fast smoke run
+        seed: Random seed for move orders and game selection
+
+    Returns:
+        JSON-serializable results with run metadata
+    """
+    sizes = [3, 10, 30] if quick else [3, 10, 30, 100]
+    resident = [10_000] if quick else [10_000, 100_000, 1_000_000]
+    return {
+        'meta': {
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'seed': seed,
+            'quick': quick,
+        },
+        'results': {
+            'board_moves_ns': bench_board_moves(sizes, 3 if quick else 5, seed),
+            'create_game': bench_create_game(20_000 if quick else 200_000, 3),
+            'make_move_latency': bench_make_move_latency(
+                resident, 20_000 if quick else 200_000, seed),
+            'bytes_per_game': bench_bytes_per_game(10_000 if quick else 100_000),
+            'churn': {
+                name: bench_churn(50_000 if quick else 500_000,
+                                  20_000 if quick else 200_000, pool_size, seed)
+                for name, pool_size in (('allocate', 0), ('pooled', 1024))
+            },
+        },
+    }
+
+
+def _flatten(tree: dict, prefix: str = '') -> Dict[str, float]:
+    """Flatten nested results into dotted metric names"""
+    flat = {}
+    for key, value in tree.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name + '.'))
+        else:
+            flat[name] = value
+    return flat
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """
+    List metrics that got worse by more than threshold
+
+    Args:
+        baseline: Earlier run_suite() output
+        current: New run_suite() output
+        threshold: Allowed relative slowdown (0.1 = 10%)
+
+    Returns:
+        Human-readable regression lines
+    """
+    old = _flatten(baseline['results'])
+    new = _flatten(current['results'])
+    regressions = []
+    for name in sorted(old.keys() & new.keys()):
+        before, after = old[name], new[name]
+        if not before:
+            continue
+        change = (after - before) / before
+        if name.endswith(HIGHER_IS_BETTER):
+            change = -change
+        if change > threshold:
+            regressions.append(f"{name}: {before} -> {after} ({change:+.1%} worse)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe benchmark suite")
+    parser.add_argument('--quick', action='store_true', help="smaller sizes for a smoke run")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write JSON here instead of stdout")
+    parser.add_argument('--compare', help="earlier JSON result to check for regressions")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed relative regression (default 0.10)")
+    args = parser.parse_args()
+
+    results = run_suite(args.quick, args.seed)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
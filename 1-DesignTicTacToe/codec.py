@@ -0,0 +1,418 @@
+"""
+Compact binary codec for Game and Board state
+
+This module includes:
+- encode_game / decode_game for single games
+- GameView, a zero-copy reader over an encoded game in a memoryview
+- encode_games / decode_games / iter_game_views for many games in one buffer
+
+Record layout, version 1 (varints are unsigned LEB128):
+    u8 magic 'G' | u8 version | u8 flags | u8 status
+    varint size | varint win_length (0 = size)
+    game_id: varint (flags bit 0 set) or varint length + UTF-8
+    player1_id, player2_id: varint length + UTF-8
+    varint move count | one varint cell index (row * size + col) per move
+    board: 2 bits per cell (0 empty, 1 X, 2 O), cell i at bits 2i..2i+1
+Moves alternate starting with player1 (X), so they carry no player.
+Status codes are indices into STATUSES.
+
+A bulk buffer is a varint game count followed by varint-length-prefixed
+records, so readers can skip a game without parsing it.
+
+Usage:
+    python codec.py [num_games]
+"""
+
+import json
+import sys
+import time
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+from solution import Board, Game, GameStatus, MoveStack, Player
+
+
+MAGIC = 0x47  # 'G'
+VERSION = 1
+
+FLAG_INT_ID = 1
+
+STATUSES = (GameStatus.IN_PROGRESS, GameStatus.X_WON, GameStatus.O_WON,
+            GameStatus.DRAW, GameStatus.FINISHED, GameStatus.X_FORFEIT,
+            GameStatus.O_FORFEIT)
+_STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+_SYMBOLS = ('', 'X', 'O')
+
+
+def _encode_varint(value: int, out: bytearray):
+    """Append an unsigned LEB128 varint"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf, offset: int) -> Tuple[int, int]:
+    """Read an unsigned LEB128 varint, returning it and the next offset"""
+    byte = buf[offset]
+    if byte < 0x80:
+        return byte, offset + 1
+    value = byte & 0x7F
+    shift = 7
+    while True:
+        offset += 1
+        byte = buf[offset]
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset + 1
+        shift += 7
+
+
+def _encode_str(value: str, out: bytearray):
+    """Append a varint length-prefixed UTF-8 string"""
+    data = value.encode()
+    _encode_varint(len(data), out)
+    out += data
+
+
+def _move_cells(game: Game) -> List[int]:
+    """Cell indices of the game's moves, in order"""
+    history = game.moves_history
+    if isinstance(history, array):  # CompactGame stores cell indices already
+        return history.tolist()  # bytes() of the array itself would give 2 bytes per index
+    size = game.board.size
+    if isinstance(history, MoveStack):
+        return [row * size + col for _, _, row, col in history]
+    return [move['row'] * size + move['col'] for move in history]
+
+
+def encode_game(game: Game, out: Optional[bytearray] = None) -> bytearray:
+    """
+    Encode a game
+
+    Args:
+        game: Game (any Game subclass and board backend)
+        out: Buffer to append to (default: new bytearray)
+
+    Returns:
+        The buffer holding the encoded game
+    """
+    if out is None:
+        out = bytearray()
+    board = game.board
+    size = board.size
+    game_id = game.game_id
+    int_id = isinstance(game_id, int)
+    out += bytes((MAGIC, VERSION, FLAG_INT_ID if int_id else 0, _STATUS_CODES[game.status]))
+    _encode_varint(size, out)
+    win_length = getattr(board, 'win_length', size)
+    _encode_varint(0 if win_length == size else win_length, out)
+    if int_id:
+        _encode_varint(game_id, out)
+    else:
+        _encode_str(game_id, out)
+    _encode_str(game.player1.player_id, out)
+    _encode_str(game.player2.player_id, out)
+
+    cells = _move_cells(game)
+    _encode_varint(len(cells), out)
+    if size * size <= 128:
+        out += bytes(cells)  # every index fits in one varint byte
+    else:
+        for index in cells:
+            _encode_varint(index, out)
+
+    packed = 0
+    for i, index in enumerate(cells):
+        packed |= (1 + (i & 1)) << (2 * index)
+    out += packed.to_bytes((size * size + 3) // 4, 'little')
+    return out
+
+
+class GameView:
+    """
+    Read-only view of an encoded game, without copying the buffer
+
+    The header is parsed on construction; player IDs, moves and cells are
+    read from the underlying memoryview only when asked for.
+    """
+
+    __slots__ = ('buf', 'status', 'size', 'win_length', '_id', '_players_at',
+                 'moves_at', 'num_moves', 'cells_at', 'end')
+
+    def __init__(self, buf, offset: int = 0):
+        """
+        Args:
+            buf: bytes, bytearray or memoryview holding the record
+            offset: Start of the record within buf
+
+        Raises:
+            ValueError: If the magic byte or version is unknown
+        """
+        buf = memoryview(buf)
+        if buf[offset] != MAGIC:
+            raise ValueError("Not an encoded game")
+        if buf[offset + 1] != VERSION:
+            raise ValueError(f"Unsupported codec version {buf[offset + 1]}")
+        flags = buf[offset + 2]
+        self.buf = buf
+        self.status = STATUSES[buf[offset + 3]]
+        self.size, pos = _read_varint(buf, offset + 4)
+        win_length, pos = _read_varint(buf, pos)
+        self.win_length = win_length or self.size
+        if flags & FLAG_INT_ID:
+            self._id, pos = _read_varint(buf, pos)
+        else:
+            length, pos = _read_varint(buf, pos)
+            self._id = (pos, pos + length)
+            pos += length
+        self._players_at = pos
+        for _ in range(2):
+            length, pos = _read_varint(buf, pos)
+            pos += length
+        self.num_moves, pos = _read_varint(buf, pos)
+        self.moves_at = pos
+        if self.size * self.size <= 128:
+            pos += self.num_moves
+        else:
+            for _ in range(self.num_moves):
+                _, pos = _read_varint(buf, pos)
+        self.cells_at = pos
+        self.end = pos + (self.size * self.size + 3) // 4
+
+    @property
+    def game_id(self):
+        """Game ID (str, or int for integer IDs)"""
+        if isinstance(self._id, int):
+            return self._id
+        start, end = self._id
+        return str(self.buf[start:end], 'utf-8')
+
+    @property
+    def player_ids(self) -> Tuple[str, str]:
+        """(player1_id, player2_id)"""
+        buf = self.buf
+        length, pos = _read_varint(buf, self._players_at)
+        player1_id = str(buf[pos:pos + length], 'utf-8')
+        length, pos = _read_varint(buf, pos + length)
+        return player1_id, str(buf[pos:pos + length], 'utf-8')
+
+    def moves(self) -> Iterator[Tuple[int, int]]:
+        """Iterate (row, col) of each move in order"""
+        buf = self.buf
+        size = self.size
+        pos = self.moves_at
+        for _ in range(self.num_moves):
+            index, pos = _read_varint(buf, pos)
+            yield divmod(index, size)
+
+    def cell(self, row: int, col: int) -> str:
+        """Symbol at (row, col): 'X', 'O' or ''"""
+        index = row * self.size + col
+        byte = self.buf[self.cells_at + (index >> 2)]
+        return _SYMBOLS[(byte >> (2 * (index & 3))) & 3]
+
+    def get_board_state(self) -> List[List[str]]:
+        """Board as nested lists, like Board.get_board_state()"""
+        size = self.size
+        return [[self.cell(r, c) for c in range(size)] for r in range(size)]
+
+    def to_game(self, board_class: type = Board, game_class: type = Game) -> Game:
+        """
+        Rebuild a playable game by replaying its moves
+
+        Args:
+            board_class: Board backend, called with the size (and win_length
+                when it differs from the size)
+            game_class: Game class to instantiate
+
+        Returns:
+            New game with the encoded ID, players, moves and status
+        """
+        size = self.size
+        board = (board_class(size) if self.win_length == size
+                 else board_class(size, self.win_length))
+        player1_id, player2_id = self.player_ids
+        game = game_class(Player(player1_id, 'X'), Player(player2_id, 'O'), board, self.game_id)
+        players = (player1_id, player2_id)
+        for i, (row, col) in enumerate(self.moves()):
+            game.make_move(players[i & 1], row, col)
+        game.status = self.status  # e.g. FINISHED, which no move produces
+        return game
+
+
+def decode_game(buf, board_class: type = Board, game_class: type = Game) -> Game:
+    """
+    Decode a game produced by encode_game
+
+    Args:
+        buf: bytes, bytearray or memoryview
+        board_class: Board backend to rebuild on
+        game_class: Game class to instantiate
+
+    Returns:
+        Rebuilt game
+    """
+    return GameView(buf).to_game(board_class, game_class)
+
+
+def encode_games(games) -> bytearray:
+    """
+    Encode many games into one buffer
+
+    Args:
+        games: Sequence of games
+
+    Returns:
+        Varint count followed by varint-length-prefixed records
+    """
+    out = bytearray()
+    _encode_varint(len(games), out)
+    record = bytearray()
+    for game in games:
+        del record[:]
+        encode_game(game, record)
+        _encode_varint(len(record), out)
+        out += record
+    return out
+
+
+def iter_game_views(buf) -> Iterator[GameView]:
+    """
+    Iterate zero-copy views over a buffer from encode_games
+
+    Args:
+        buf: bytes, bytearray or memoryview
+
+    Returns:
+        Iterator of GameView, one per game
+    """
+    buf = memoryview(buf)
+    count, pos = _read_varint(buf, 0)
+    for _ in range(count):
+        length, pos = _read_varint(buf, pos)
+        yield GameView(buf, pos)
+        pos += length
+
+
+def decode_games(buf, board_class: type = Board, game_class: type = Game) -> List[Game]:
+    """
+    Decode every game in a buffer from encode_games
+
+    Returns:
+        Rebuilt games, in encoding order
+    """
+    return [view.to_game(board_class, game_class) for view in iter_game_views(buf)]
+
+
+def _to_json(game: Game) -> str:
+    """The JSON export the codec replaces: nested board lists and move dicts"""
+    return json.dumps({
+        'game_id': game.game_id,
+        'player1': game.player1.player_id,
+        'player2': game.player2.player_id,
+        'status': game.status.value,
+        'board': game.get_board_state(),
+        'moves': game.get_moves_history(),
+    })
+
+
+def _from_json(text: str) -> Game:
+    """Rebuild a game from _to_json output"""
+    data = json.loads(text)
+    game = Game(Player(data['player1'], 'X'), Player(data['player2'], 'O'),
+                Board(len(data['board'])), data['game_id'])
+    for move in data['moves']:
+        game.make_move(move['player_id'], move['row'], move['col'])
+    return game
+
+
+# Round-trip checks and a size/speed comparison against JSON
+if __name__ == "__main__":
+    import gc
+    import random
+
+    from solution import BitBoard, BranchGame, CompactBoard, CompactGame, SparseBoard
+
+    def same(a: Game, b: Game) -> bool:
+        return (a.game_id == b.game_id and a.status == b.status
+                and a.player1.player_id == b.player1.player_id
+                and a.player2.player_id == b.player2.player_id
+                and a.current_player.symbol == b.current_player.symbol
+                and a.get_board_state() == b.get_board_state()
+                and a.get_moves_history() == b.get_moves_history())
+
+    def random_game(rnd: random.Random, game_class: type, board, game_id, moves: int) -> Game:
+        game = game_class(Player(f"x{rnd.random():.6f}", 'X'), Player("oé", 'O'), board, game_id)
+        size = board.size
+        cells = [(r, c) for r in range(size) for c in range(size)]
+        rnd.shuffle(cells)
+        for row, col in cells[:moves]:
+            if game.status != GameStatus.IN_PROGRESS:
+                break
+            game.make_move(game.current_player.player_id, row, col)
+        return game
+
+    print("=" * 50)
+    print("Binary Codec - Round Trips")
+    print("=" * 50)
+    rnd = random.Random(0)
+    layouts = [
+        ("Game + Board 3x3", Game, lambda: Board(3), Board),
+        ("Game + BitBoard 4x4", Game, lambda: BitBoard(4), BitBoard),
+        ("CompactGame + CompactBoard 3x3", CompactGame, lambda: CompactBoard(3), CompactBoard),
+        ("CompactGame + CompactBoard 12x12", CompactGame, lambda: CompactBoard(12), CompactBoard),
+        ("BranchGame + BitBoard 3x3", BranchGame, lambda: BitBoard(3), BitBoard),
+        ("Game + SparseBoard 15x15 K=5", Game, lambda: SparseBoard(15, 5), SparseBoard),
+    ]
+    for name, game_class, make_board, board_class in layouts:
+        for trial in range(200):
+            game_id = rnd.getrandbits(64) if trial % 2 else f"game-{trial}"
+            game = random_game(rnd, game_class, make_board(), game_id, rnd.randrange(40))
+            data = encode_game(game)
+            view = GameView(memoryview(data))
+            assert view.get_board_state() == game.get_board_state()
+            assert same(decode_game(data, board_class, game_class), game), name
+        print(f"{name:34s} ok")
+    finished = random_game(rnd, Game, Board(3), "done", 9)
+    finished.status = GameStatus.FINISHED
+    assert decode_game(encode_game(finished)).status == GameStatus.FINISHED
+    games = [random_game(rnd, Game, Board(3), f"g{i}", i % 10) for i in range(100)]
+    assert all(same(a, b) for a, b in zip(games, decode_games(encode_games(games))))
+    print(f"{'bulk encode/decode (100 games)':34s} ok")
+
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print("\n" + "=" * 50)
+    print(f"Binary Codec vs JSON ({num_games} 3x3 games, 0-9 moves)")
+    print("=" * 50)
+    games = [random_game(rnd, Game, Board(3), f"{rnd.getrandbits(128):032x}", i % 10)
+             for i in range(num_games)]
+
+    def timed(fn) -> Tuple[float, object]:
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        result = fn()
+        gc.enable()
+        return (time.perf_counter() - start) / num_games * 1e9, result
+
+    json_encode_ns, texts = timed(lambda: [_to_json(game) for game in games])
+    json_decode_ns, _ = timed(lambda: [_from_json(text) for text in texts])
+    json_parse_ns, _ = timed(lambda: [json.loads(text) for text in texts])
+    bin_encode_ns, records = timed(lambda: [bytes(encode_game(game)) for game in games])
+    bin_decode_ns, _ = timed(lambda: [decode_game(record) for record in records])
+    bin_view_ns, _ = timed(lambda: [GameView(record).status for record in records])
+    bulk_encode_ns, bulk = timed(lambda: encode_games(games))
+    bulk_view_ns, _ = timed(lambda: sum(1 for _ in iter_game_views(bulk)))
+
+    json_bytes = sum(len(text.encode()) for text in texts) / num_games
+    bin_bytes = sum(len(record) for record in records) / num_games
+    print(f"{'size':24s} json {json_bytes:7.1f} B   binary {bin_bytes:7.1f} B "
+          f"({bin_bytes / json_bytes:.0%})")
+    print(f"{'encode':24s} json {json_encode_ns:7.0f} ns  binary {bin_encode_ns:7.0f} ns")
+    print(f"{'decode to Game':24s} json {json_decode_ns:7.0f} ns  binary {bin_decode_ns:7.0f} ns")
+    print(f"{'parse only / GameView':24s} json {json_parse_ns:7.0f} ns  binary {bin_view_ns:7.0f} ns")
+    print(f"{'bulk encode / views':24s} {bulk_encode_ns:7.0f} ns / {bulk_view_ns:.0f} ns per game, "
+          f"{len(bulk) / num_games:.1f} B per game")
+    print("\n" + "=" * 50)
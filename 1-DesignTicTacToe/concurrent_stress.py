@@ -0,0 +1,135 @@
+"""
+Stress test for ConcurrentGameManager
+
+Hammers a shared set of games from many threads with moves for both
+players (so most calls race on the turn check), then verifies that
+every game is consistent:
+- each SUCCESS returned to a caller appears exactly once in moves_history
+- the board holds exactly one stone per recorded move
+- recorded symbols strictly alternate starting with X
+
+Also reports move throughput as the thread count grows. On a GIL build
+the striped locks remove contention between games but Python bytecode
+still runs on one core, so expect flat scaling there and near-linear
+scaling on a free-threaded build.
+"""
+
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from typing import List, Tuple
+
+from solution import Board, ConcurrentGameManager, GameManager
+
+
+# Guards merging per-thread success counts into the shared Counter
+_merge_lock = threading.Lock()
+
+
+def _play(manager: GameManager, game_ids: List[str], num_moves: int, size: int,
+          seed: int, successes: Counter):
+    """Worker: send random moves for random players to random games"""
+    rnd = random.Random(seed)
+    local = Counter()
+    for _ in range(num_moves):
+        index = rnd.randrange(len(game_ids))
+        player_id = f"{'x' if rnd.random() < 0.5 else 'o'}{index}"
+        result = manager.make_move(game_ids[index], player_id,
+                                   rnd.randrange(size), rnd.randrange(size))
+        if result == 'SUCCESS':
+            local[game_ids[index]] += 1
+    # Counter.update is not atomic; merge once at the end
+    with _merge_lock:
+        successes.update(local)
+
+
+def check_consistency(manager: GameManager, successes: Counter) -> List[str]:
+    """
+    Verify every game against the SUCCESS results seen by callers
+
+    Args:
+        manager: Manager after the run
+        successes: game_id -> number of SUCCESS results returned
+
+    Returns:
+        List of human-readable violations (empty if consistent)
+    """
+    violations = []
+    for game_id, game in manager.games.items():
+        history = game.get_moves_history()
+        stones = sum(cell != '' for row in game.get_board_state() for cell in row)
+        if successes[game_id] != len(history):
+            violations.append(f"{game_id}: {successes[game_id]} SUCCESS, {len(history)} recorded")
+        if stones != len(history):
+            violations.append(f"{game_id}: {stones} stones, {len(history)} recorded")
+        for i, move in enumerate(history):
+            if move['symbol'] != ('X' if i % 2 == 0 else 'O'):
+                violations.append(f"{game_id}: move {i} played by {move['symbol']}")
+                break
+    return violations
+
+
+def run_stress(manager: GameManager, num_games: int, num_threads: int,
+               moves_per_thread: int, size: int, seed: int = 0) -> Tuple[float, List[str]]:
+    """
+    Run one stress round
+
+    Args:
+        manager: Empty manager to drive
+        num_games: Number of shared games
+        num_threads: Number of worker threads
+        moves_per_thread: Moves each worker sends
+        size: Board size used by the manager's board_factory
+        seed: Base random seed
+
+    Returns:
+        Tuple of (moves per second, violations)
+    """
+    game_ids = [manager.create_game(f"x{i}", f"o{i}") for i in range(num_games)]
+    successes: Counter = Counter()
+    threads = [
+        threading.Thread(target=_play,
+                         args=(manager, game_ids, moves_per_thread, size, seed + t, successes))
+        for t in range(num_threads)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return num_threads * moves_per_thread / elapsed, check_consistency(manager, successes)
+
+
+if __name__ == "__main__":
+    size = 8
+    num_games = 200
+    moves_per_thread = 50000
+    factory = lambda: Board(size)
+
+    # Switch threads as often as possible to provoke interleavings
+    sys.setswitchinterval(1e-6)
+
+    print("=" * 50)
+    print("ConcurrentGameManager - Stress Test")
+    print("=" * 50)
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil}")
+
+    for num_threads in (1, 2, 4, 8):
+        manager = ConcurrentGameManager(board_factory=factory)
+        rate, violations = run_stress(manager, num_games, num_threads,
+                                      moves_per_thread // num_threads, size)
+        print(f"{num_threads} threads: {rate:,.0f} moves/s, "
+              f"{len(violations)} violations")
+        for violation in violations[:5]:
+            print(f"  {violation}")
+
+    print("\n--- Unsynchronized GameManager (for comparison) ---")
+    manager = GameManager(board_factory=factory)
+    rate, violations = run_stress(manager, num_games, 8, moves_per_thread // 8, size)
+    print(f"8 threads: {rate:,.0f} moves/s, {len(violations)} violations")
+
+    print("\n" + "=" * 50)
@@ -0,0 +1,317 @@
+"""
+Load generator and soak-test harness for GameManager
+
+Simulates a population of players against an in-process manager (or any
+object with create_game / make_move / delete_game):
+- games start as a Poisson process at creation_rate games per second
+- each turn waits a think time drawn from a configurable distribution
+- a share of moves are deliberately invalid or sent out of turn
+- some games are abandoned mid-play and left resident
+- finished games are deleted by their players (optional)
+
+Time is simulated: the harness advances a virtual clock from event to
+event instead of sleeping, so hours of traffic run as fast as the
+manager allows while every call's real latency is measured. With a
+fixed seed the exact same sequence of calls is replayed, and the
+result-code mix is identical between runs.
+
+Reports throughput, p50/p99/p999 latency per operation, result-code mix,
+game counts, and resident set size sampled over virtual time (to spot
+leaks in long soaks).
+
+Usage:
+    python load_test.py --seed 1 --duration 600 --creation-rate 200
+    python load_test.py --manager slot --think exp --invalid 0.05 --json
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from metrics import LatencyHistogram
+from solution import GameManager, SlotGameManager
+
+
+THINK_DISTRIBUTIONS = ('fixed', 'uniform', 'exp', 'lognormal')
+
+
+def _rss_bytes() -> int:
+    """Current resident set size in bytes (peak RSS where /proc is missing)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def think_time_sampler(rnd: random.Random, distribution: str, mean: float) -> Callable[[], float]:
+    """
+    Build a think-time sampler
+
+    Args:
+        rnd: Random source
+        distribution: 'fixed', 'uniform' (0 to 2*mean), 'exp' or
+            'lognormal' (sigma 1, heavy-tailed)
+        mean: Mean think time in seconds
+
+    Returns:
+        Callable returning one think time
+    """
+    if distribution == 'fixed':
+        return lambda: mean
+    if distribution == 'uniform':
+        return lambda: rnd.uniform(0, 2 * mean)
+    if distribution == 'exp':
+        return lambda: rnd.expovariate(1 / mean) if mean > 0 else 0.0
+    if distribution == 'lognormal':
+        # mu chosen so the mean is `mean` with sigma = 1
+        mu = math.log(mean) - 0.5 if mean > 0 else 0.0
+        return lambda: rnd.lognormvariate(mu, 1.0) if mean > 0 else 0.0
+    raise ValueError(f"Unknown think-time distribution {distribution!r}")
+
+
+class LoadTest:
+    """One simulated run against a manager"""
+
+    def __init__(self, manager, num_players: int = 10000, creation_rate: float = 100.0,
+                 duration: float = 60.0, size: int = 3,
+                 think: str = 'exp', think_mean: float = 2.0,
+                 invalid_rate: float = 0.02, out_of_turn_rate: float = 0.02,
+                 abandon_rate: float = 0.01, delete_finished: bool = True,
+                 sample_interval: float = 10.0, seed: Optional[int] = None):
+        """
+        Configure a run
+
+        Args:
+            manager: GameManager or anything with the same API
+            num_players: Size of the player population games draw from
+            creation_rate: Mean new games per virtual second
+            duration: Virtual seconds during which games are created
+            size: Board size
+            think: Think-time distribution (see THINK_DISTRIBUTIONS)
+            think_mean: Mean think time in virtual seconds
+            invalid_rate: Share of moves aimed at an occupied or off-board cell
+            out_of_turn_rate: Share of moves sent by the waiting player
+            abandon_rate: Chance per turn that both players walk away
+            delete_finished: Delete games once they are over
+            sample_interval: Virtual seconds between RSS samples
+            seed: Random seed (None picks one; it is reported either way)
+        """
+        self.manager = manager
+        self.num_players = num_players
+        self.creation_rate = creation_rate
+        self.duration = duration
+        self.size = size
+        self.invalid_rate = invalid_rate
+        self.out_of_turn_rate = out_of_turn_rate
+        self.abandon_rate = abandon_rate
+        self.delete_finished = delete_finished
+        self.sample_interval = sample_interval
+        self.seed = seed if seed is not None else random.randrange(1 << 32)
+        self.rnd = random.Random(self.seed)
+        self.think_time = think_time_sampler(self.rnd, think, think_mean)
+
+        self.latency = {op: LatencyHistogram() for op in ('create_game', 'make_move', 'delete_game')}
+        self.results: Counter = Counter()
+        self.games = Counter()  # created / finished / abandoned
+        self.samples: List[Dict[str, float]] = []
+
+    def run(self) -> dict:
+        """
+        Run the simulation until every game is finished or abandoned
+
+        Returns:
+            JSON-serializable report
+        """
+        rnd = self.rnd
+        manager = self.manager
+        clock = time.perf_counter_ns
+        size = self.size
+        all_cells = [(r, c) for r in range(size) for c in range(size)]
+        create_hist = self.latency['create_game']
+        move_hist = self.latency['make_move']
+        delete_hist = self.latency['delete_game']
+
+        # (virtual time, sequence, game state or None for "create a game")
+        events = [(rnd.expovariate(self.creation_rate), 0, None)]
+        sequence = 1
+        next_sample = 0.0
+        rss_start = _rss_bytes()
+        real_start = time.perf_counter()
+        now = 0.0
+
+        while events:
+            now, _, state = heapq.heappop(events)
+            if now >= next_sample:
+                self._sample(now, real_start, rss_start)
+                next_sample += self.sample_interval
+
+            if state is None:
+                player1 = f"p{rnd.randrange(self.num_players)}"
+                player2 = f"p{rnd.randrange(self.num_players)}"
+                if player1 == player2:
+                    player2 += "'"
+                start = clock()
+                game_id = manager.create_game(player1, player2)
+                create_hist.record(clock() - start)
+                self.games['created'] += 1
+                cells = all_cells[:]
+                rnd.shuffle(cells)
+                # [game_id, players, turn, remaining empty cells in play order]
+                state = [game_id, (player1, player2), 0, cells]
+                heapq.heappush(events, (now + self.think_time(), sequence, state))
+                sequence += 1
+                arrival = now + rnd.expovariate(self.creation_rate)
+                if arrival < self.duration:
+                    heapq.heappush(events, (arrival, sequence, None))
+                    sequence += 1
+                continue
+
+            if rnd.random() < self.abandon_rate:
+                self.games['abandoned'] += 1
+                continue
+
+            game_id, players, turn, cells = state
+            roll = rnd.random()
+            if roll < self.out_of_turn_rate:
+                move = (players[1 - turn], *cells[-1])
+            elif roll < self.out_of_turn_rate + self.invalid_rate:
+                taken = [cell for cell in all_cells if cell not in cells]
+                if taken and rnd.random() < 0.5:
+                    row, col = rnd.choice(taken)
+                else:
+                    row, col = size, rnd.randrange(size)  # off the board
+                move = (players[turn], row, col)
+            else:
+                move = (players[turn], *cells[-1])
+
+            start = clock()
+            result = manager.make_move(game_id, *move)
+            move_hist.record(clock() - start)
+            self.results[result] += 1
+
+            if result == 'SUCCESS':
+                cells.pop()
+                state[2] = 1 - turn
+                over = not cells
+            else:
+                # A win is only seen by the clients as GAME_OVER on the next move
+                over = result in ('GAME_OVER', 'GAME_NOT_FOUND')
+            if over:
+                self.games['finished'] += 1
+                if self.delete_finished:
+                    start = clock()
+                    manager.delete_game(game_id)
+                    delete_hist.record(clock() - start)
+                continue
+            heapq.heappush(events, (now + self.think_time(), sequence, state))
+            sequence += 1
+
+        if self.samples[-1]['virtual_s'] != round(now, 1):
+            self._sample(now, real_start, rss_start)
+        return self.report(time.perf_counter() - real_start)
+
+    def _sample(self, virtual_time: float, real_start: float, rss_start: int):
+        """Record RSS growth and progress at a point in virtual time"""
+        resident = len(getattr(self.manager, 'games', ()))
+        self.samples.append({
+            'virtual_s': round(virtual_time, 1),
+            'real_s': round(time.perf_counter() - real_start, 3),
+            'rss_growth_mb': round((_rss_bytes() - rss_start) / 2**20, 2),
+            'resident_games': resident,
+        })
+
+    def report(self, elapsed: float) -> dict:
+        """
+        Summarize the run
+
+        Args:
+            elapsed: Real seconds the run took
+
+        Returns:
+            JSON-serializable report
+        """
+        operations = sum(hist.count for hist in self.latency.values())
+        total_moves = sum(self.results.values())
+        return {
+            'seed': self.seed,
+            'elapsed_s': round(elapsed, 3),
+            'operations': operations,
+            'ops_per_second': round(operations / elapsed) if elapsed else 0,
+            'latency': {op: hist.summary() for op, hist in self.latency.items() if hist.count},
+            'results': {result: count for result, count in self.results.most_common()},
+            'result_mix': {result: round(count / total_moves, 4)
+                           for result, count in self.results.most_common()},
+            'games': dict(self.games),
+            'samples': self.samples,
+        }
+
+
+MANAGERS = {
+    'dict': GameManager,
+    'slot': SlotGameManager,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GameManager load generator")
+    parser.add_argument('--manager', choices=sorted(MANAGERS), default='dict')
+    parser.add_argument('--players', type=int, default=10000)
+    parser.add_argument('--creation-rate', type=float, default=100.0, help="games per virtual second")
+    parser.add_argument('--duration', type=float, default=60.0, help="virtual seconds of game creation")
+    parser.add_argument('--size', type=int, default=3)
+    parser.add_argument('--think', choices=THINK_DISTRIBUTIONS, default='exp')
+    parser.add_argument('--think-mean', type=float, default=2.0)
+    parser.add_argument('--invalid', type=float, default=0.02)
+    parser.add_argument('--out-of-turn', type=float, default=0.02)
+    parser.add_argument('--abandon', type=float, default=0.01)
+    parser.add_argument('--keep-finished', action='store_true', help="do not delete finished games")
+    parser.add_argument('--max-games', type=int, help="enable LRU eviction (dict manager)")
+    parser.add_argument('--sample-interval', type=float, default=10.0)
+    parser.add_argument('--seed', type=int, help="fixed seed for a reproducible run")
+    parser.add_argument('--json', action='store_true', help="print the full JSON report")
+    args = parser.parse_args()
+
+    if args.max_games is not None:
+        if args.manager != 'dict':
+            parser.error("--max-games needs --manager dict")
+        manager = GameManager(max_games=args.max_games)
+    else:
+        manager = MANAGERS[args.manager]()
+    test = LoadTest(manager, args.players, args.creation_rate, args.duration, args.size,
+                    args.think, args.think_mean, args.invalid, args.out_of_turn, args.abandon,
+                    not args.keep_finished, args.sample_interval, args.seed)
+    report = test.run()
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print("=" * 50)
+    print(f"Load Test (seed {report['seed']})")
+    print("=" * 50)
+    print(f"{report['operations']:,} operations in {report['elapsed_s']}s "
+          f"({report['ops_per_second']:,} ops/s)")
+    for op, summary in report['latency'].items():
+        print(f"{op:12s} p50 {summary['p50_ns']:>7,} ns  p99 {summary['p99_ns']:>7,} ns  "
+              f"p999 {summary['p999_ns']:>8,} ns")
+    print("Results: " + ", ".join(f"{result} {share:.1%}"
+                                  for result, share in report['result_mix'].items()))
+    print("Games: " + ", ".join(f"{kind} {count:,}" for kind, count in report['games'].items()))
+    print("\nvirtual_s  real_s  resident  rss_growth_mb")
+    for sample in report['samples']:
+        print(f"{sample['virtual_s']:9.1f} {sample['real_s']:7.2f} {sample['resident_games']:9,} "
+              f"{sample['rss_growth_mb']:14.2f}")
+    print("\n" + "=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Matchmaking queue for GameManager
+
+This module includes:
+- MatchmakingQueue class that pairs waiting players, optionally within
+  rating buckets, and creates their games in batches
+
+Each bucket is a FIFO of waiting players. An arriving player is paired
+with the longest-waiting player in its bucket in O(1); pairs accumulate
+until batch_size is reached (or flush() is called) and are then created
+with one GameManager.create_games call. Nothing is ever scanned.
+
+Usage:
+    python matchmaking.py [num_players]
+"""
+
+import random
+import sys
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+from solution import GameManager
+
+
+class MatchmakingQueue:
+    """Pairs waiting players and starts their games in batches"""
+
+    def __init__(self, manager: GameManager, batch_size: int = 256,
+                 bucket_width: Optional[float] = None,
+                 on_match: Optional[Callable[[str, str, str], None]] = None):
+        """
+        Initialize the queue
+
+        Args:
+            manager: GameManager the games are created in
+            batch_size: Pairs to collect before creating their games
+            bucket_width: Rating range per bucket; None pairs everyone together
+            on_match: Callback(player1_id, player2_id, game_id) per created game
+        """
+        self.manager = manager
+        self.batch_size = batch_size
+        self.bucket_width = bucket_width
+        self.on_match = on_match
+        self.buckets: Dict[Hashable, Deque[str]] = {}
+        self.waiting: Dict[str, Hashable] = {}  # player_id -> bucket key
+        self.pending: List[Tuple[str, str]] = []  # pairs awaiting create_games
+        self.matched = 0
+
+    def _bucket_key(self, rating: Optional[float]) -> Hashable:
+        """Bucket a rating falls into"""
+        if self.bucket_width is None or rating is None:
+            return None
+        return int(rating // self.bucket_width)
+
+    def enqueue(self, player_id: str, rating: Optional[float] = None) -> bool:
+        """
+        Add a player to the queue
+
+        Args:
+            player_id: Player ID
+            rating: Player rating, used when bucket_width is set
+
+        Returns:
+            True if queued, False if the player is already waiting
+        """
+        if player_id in self.waiting:
+            return False
+        key = self._bucket_key(rating)
+        queue = self.buckets.get(key)
+        if queue is None:
+            queue = self.buckets[key] = deque()
+        waiting = self.waiting
+        # Skip entries of players who cancelled while waiting
+        while queue:
+            opponent = queue.popleft()
+            if opponent in waiting and waiting[opponent] == key:
+                del waiting[opponent]
+                self.pending.append((opponent, player_id))  # longest waiter plays X
+                if len(self.pending) >= self.batch_size:
+                    self.flush()
+                return True
+        queue.append(player_id)
+        waiting[player_id] = key
+        return True
+
+    def cancel(self, player_id: str) -> bool:
+        """
+        Remove a waiting player
+
+        The bucket entry is dropped lazily when it reaches the front.
+
+        Args:
+            player_id: Player ID
+
+        Returns:
+            True if the player was waiting
+        """
+        if player_id not in self.waiting:
+            return False
+        del self.waiting[player_id]
+        return True
+
+    def flush(self) -> List[str]:
+        """
+        Create games for every pending pair
+
+        Returns:
+            The new game IDs, in pairing order
+        """
+        pairs, self.pending = self.pending, []
+        if not pairs:
+            return []
+        game_ids = self.manager.create_games(pairs)
+        self.matched += len(pairs)
+        if self.on_match is not None:
+            for (player1_id, player2_id), game_id in zip(pairs, game_ids):
+                self.on_match(player1_id, player2_id, game_id)
+        return game_ids
+
+    def __len__(self) -> int:
+        """Number of players still waiting"""
+        return len(self.waiting)
+
+
+# Throughput check: pair a stream of rated players
+if __name__ == "__main__":
+    from solution import SlotGameManager
+
+    num_players = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rnd = random.Random(0)
+    arrivals = [(f"p{i}", rnd.gauss(1500, 300)) for i in range(num_players)]
+
+    print("=" * 50)
+    print(f"Matchmaking ({num_players} players)")
+    print("=" * 50)
+    for name, manager_class, bucket_width in [
+        ("uuid IDs, one bucket", GameManager, None),
+        ("uuid IDs, 100-point buckets", GameManager, 100),
+        ("integer IDs, 100-point buckets", SlotGameManager, 100),
+    ]:
+        manager = manager_class()
+        queue = MatchmakingQueue(manager, bucket_width=bucket_width)
+        start = time.perf_counter()
+        for player_id, rating in arrivals:
+            queue.enqueue(player_id, rating)
+        queue.flush()
+        elapsed = time.perf_counter() - start
+        print(f"{name:32s} {queue.matched / elapsed:9.0f} pairings/s, "
+              f"{len(queue)} left waiting")
+
+    player_id = arrivals[0][0]
+    print(f"\nActive games of {player_id}: {manager.get_player_games(player_id)}")
+    print("\n" + "=" * 50)
@@ -0,0 +1,69 @@
+"""
+Memory-per-game measurement for the game layouts
+
+Creates many resident games through GameManager, plays a few moves in
+each, and reports the traced heap bytes per game for:
+- Game + Board (list-of-lists board, dict move history)
+- Game + BitBoard (two ints per board, dict move history)
+- CompactGame + CompactBoard (bytearray board, array('H') move history)
+
+Usage:
+    python memory_usage.py [num_games] [moves_per_game]
+"""
+
+import sys
+import tracemalloc
+from typing import Callable
+
+from solution import Board, BitBoard, CompactBoard, CompactGame, Game, GameManager
+
+# Moves that never finish a 3x3 game early: X(0,0) O(1,1) X(0,1) O(0,2) X(2,0) ...
+_OPENING = [(0, 0), (1, 1), (0, 1), (0, 2), (2, 0), (1, 0), (1, 2), (2, 1), (2, 2)]
+
+
+def bytes_per_game(board_factory: Callable[[], object], game_class: type,
+                   num_games: int, moves_per_game: int) -> float:
+    """
+    Measure heap bytes retained per resident game
+
+    Args:
+        board_factory: Board backend for the manager
+        game_class: Game class for the manager
+        num_games: Number of games to create
+        moves_per_game: Moves to play in each game (at most 9)
+
+    Returns:
+        Average traced bytes per game, including its game_id and players
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    manager = GameManager(board_factory=board_factory, game_class=game_class)
+    for i in range(num_games):
+        player1, player2 = f"x{i}", f"o{i}"
+        game_id = manager.create_game(player1, player2)
+        for turn, (row, col) in enumerate(_OPENING[:moves_per_game]):
+            manager.make_move(game_id, player1 if turn % 2 == 0 else player2, row, col)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del manager
+    return (after - before) / num_games
+
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    moves_per_game = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print("=" * 50)
+    print(f"Memory per game ({num_games} games, {moves_per_game} moves each)")
+    print("=" * 50)
+    layouts = [
+        ("Game + Board", Board, Game),
+        ("Game + BitBoard", BitBoard, Game),
+        ("CompactGame + CompactBoard", CompactBoard, CompactGame),
+    ]
+    baseline = None
+    for name, board_factory, game_class in layouts:
+        size = bytes_per_game(board_factory, game_class, num_games, moves_per_game)
+        baseline = baseline or size
+        print(f"{name:28s} {size:8.0f} bytes/game ({size / baseline:.0%})")
+    print("\n" + "=" * 50)
@@ -0,0 +1,335 @@
+"""
+Instrumentation for GameManager
+
+This module includes:
+- LatencyHistogram class, an HDR-style log-linear latency histogram
+- Metrics class recording counters, latencies and game rates
+- Exporter base class and JsonLinesExporter
+
+Pass a Metrics instance as GameManager(metrics=...). The manager then
+times create_game, get_game, make_move and delete_game, counts every
+make_move result code ('SUCCESS', 'INVALID_MOVE', ...) and reports
+finished games. Without metrics the manager skips all of this.
+
+Counters are always exact. Latencies can be sampled with sample_every=N:
+only one call in N reads the clock, updates a histogram and runs the
+hooks; for the others the manager just decrements a countdown (and
+counts a rejected make_move). Timing a call costs about 0.75us in
+CPython, so timing every call adds roughly 45% to the demo workload
+below (3x3 games of ~1us moves); with sample_every=64 the overhead
+measured about 5%. Use sampling on hot paths.
+"""
+
+import json
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, TextIO
+
+from solution import MOVE_RESULTS
+
+
+# Operations GameManager reports
+OPERATIONS = ('create_game', 'get_game', 'make_move', 'delete_game')
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of nanosecond latencies
+
+    Values below 32 are exact; above that every power of two is split
+    into 16 sub-buckets, so a reported percentile is within 1/16 (6.25%)
+    of the true value, with fixed memory and O(1) recording.
+    """
+
+    SUB_BUCKETS = 16
+    _NUM_BUCKETS = 64 * SUB_BUCKETS
+
+    def __init__(self):
+        """Initialize an empty histogram"""
+        self.buckets = [0] * self._NUM_BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int):
+        """
+        Record one latency
+
+        Args:
+            value: Latency in nanoseconds
+        """
+        if value < 32:
+            index = value if value > 0 else 0
+        else:
+            shift = value.bit_length() - 5
+            index = (shift + 1) * 16 + ((value >> shift) & 15)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @staticmethod
+    def _bucket_value(index: int) -> int:
+        """Highest value that maps to a bucket"""
+        if index < 32:
+            return index
+        shift = index // 16 - 1
+        return ((16 + index % 16 + 1) << shift) - 1
+
+    def percentile(self, fraction: float) -> int:
+        """
+        Get a latency percentile
+
+        Args:
+            fraction: Percentile as a fraction (0.99 for p99)
+
+        Returns:
+            Upper bound of the bucket holding that rank (0 if empty)
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, int(fraction * self.count + 0.5))
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return min(self._bucket_value(index), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize the histogram
+
+        Returns:
+            Dict with count, mean and p50/p90/p99/p999/max in nanoseconds
+        """
+        return {
+            'count': self.count,
+            'mean_ns': round(self.total / self.count, 1) if self.count else 0,
+            'p50_ns': self.percentile(0.50),
+            'p90_ns': self.percentile(0.90),
+            'p99_ns': self.percentile(0.99),
+            'p999_ns': self.percentile(0.999),
+            'max_ns': self.max,
+        }
+
+
+class Exporter(ABC):
+    """Receives metric snapshots from Metrics.export()"""
+
+    @abstractmethod
+    def export(self, snapshot: dict):
+        """
+        Publish one snapshot
+
+        Args:
+            snapshot: Dict returned by Metrics.snapshot()
+        """
+
+
+class JsonLinesExporter(Exporter):
+    """Writes each snapshot as one JSON line"""
+
+    def __init__(self, stream: TextIO = sys.stdout):
+        """
+        Args:
+            stream: Text stream to write to
+        """
+        self.stream = stream
+
+    def export(self, snapshot: dict):
+        self.stream.write(json.dumps(snapshot) + '\n')
+        self.stream.flush()
+
+
+class Metrics:
+    """
+    Counters, latency histograms and rates for one GameManager
+
+    To keep unsampled calls cheap the manager does the sampling itself:
+    each operation has a countdown (until_create_game, until_get_game,
+    until_make_move, until_delete_game) that every call decrements; while
+    it is nonzero that is all the call records, apart from counting a
+    make_move that was rejected in rejected_counts. A call that brings it
+    to 0 goes through start() and finish(). Operation counts are derived
+    from the countdowns and histogram counts, and SUCCESS from those, so
+    every counter stays exact.
+    """
+
+    def __init__(self, sample_every: int = 1, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize empty metrics
+
+        Args:
+            sample_every: Put one latency in N into the histograms
+            clock: Time source in seconds, used for rates
+        """
+        self.sample_every = sample_every
+        self.clock = clock
+        # make_move results other than SUCCESS
+        self.rejected_counts = {result: 0 for result in MOVE_RESULTS if result != 'SUCCESS'}
+        self.histograms = {op: LatencyHistogram() for op in OPERATIONS}
+        self.games_finished = 0
+        self.hooks: List[Callable[[str, int, Optional[str]], None]] = []
+        self.exporters: List[Exporter] = []
+        # Calls left until each operation's next sampled call
+        self.until_create_game = 1
+        self.until_get_game = 1
+        self.until_make_move = 1
+        self.until_delete_game = 1
+        self._last_time = clock()
+        self._last_created = 0
+        self._last_finished = 0
+
+    @property
+    def operation_counts(self) -> Dict[str, int]:
+        """Exact number of calls of each operation"""
+        return {op: self.histograms[op].count * self.sample_every + 1
+                - getattr(self, 'until_' + op) for op in OPERATIONS}
+
+    @property
+    def result_counts(self) -> Dict[str, int]:
+        """Exact number of make_move calls with each result code"""
+        counts = dict(self.rejected_counts)
+        counts['SUCCESS'] = self.operation_counts['make_move'] - sum(counts.values())
+        return {result: counts[result] for result in MOVE_RESULTS}
+
+    def start(self, operation: str) -> int:
+        """
+        Begin timing a sampled call (once its countdown reaches 0)
+
+        Args:
+            operation: 'create_game', 'get_game', 'make_move' or 'delete_game'
+
+        Returns:
+            Start timestamp in nanoseconds
+        """
+        setattr(self, 'until_' + operation, self.sample_every)
+        return time.perf_counter_ns()
+
+    def finish(self, operation: str, start: int, result: Optional[str] = None):
+        """
+        Record a sampled operation
+
+        Args:
+            operation: 'create_game', 'get_game', 'make_move' or 'delete_game'
+            start: Value returned by start()
+            result: make_move result code, if any
+        """
+        latency_ns = time.perf_counter_ns() - start
+        if result is not None and result != 'SUCCESS':
+            self.rejected_counts[result] += 1
+        self.histograms[operation].record(latency_ns)
+        if self.hooks:
+            for hook in self.hooks:
+                hook(operation, latency_ns, result)
+
+    def record_finished(self):
+        """Count a game that just ended in a win or draw"""
+        self.games_finished += 1
+
+    def add_hook(self, hook: Callable[[str, int, Optional[str]], None]):
+        """
+        Call hook(operation, latency_ns, result) after every sampled operation
+
+        Unsampled calls only update the counters, so with sample_every=N
+        a hook sees about one call in N.
+
+        Args:
+            hook: Callable; keep it cheap, it runs on the request path
+        """
+        self.hooks.append(hook)
+
+    def add_exporter(self, exporter: Exporter):
+        """
+        Register an exporter for export()
+
+        Args:
+            exporter: Exporter instance
+        """
+        self.exporters.append(exporter)
+
+    def snapshot(self) -> dict:
+        """
+        Take a snapshot of all metrics
+
+        Rates are computed over the interval since the previous snapshot.
+
+        Returns:
+            JSON-serializable dict
+        """
+        now = self.clock()
+        elapsed = now - self._last_time
+        operations = self.operation_counts
+        created = operations['create_game']
+        finished = self.games_finished
+        snapshot = {
+            'results': self.result_counts,
+            'operations': operations,
+            'latency': {op: hist.summary() for op, hist in self.histograms.items()
+                        if hist.count},
+            'games_created': created,
+            'games_finished': finished,
+            'games_created_per_second':
+                round((created - self._last_created) / elapsed, 1) if elapsed > 0 else 0.0,
+            'games_finished_per_second':
+                round((finished - self._last_finished) / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+        self._last_time = now
+        self._last_created = created
+        self._last_finished = finished
+        return snapshot
+
+    def export(self):
+        """Take a snapshot and hand it to every exporter"""
+        snapshot = self.snapshot()
+        for exporter in self.exporters:
+            exporter.export(snapshot)
+
+
+# Overhead check: the same workload with metrics off, on, and sampled
+if __name__ == "__main__":
+    import random
+
+    from solution import GameManager
+
+    def workload(manager: GameManager, num_games: int, seed: int) -> float:
+        rnd = random.Random(seed)
+        start = time.perf_counter()
+        for i in range(num_games):
+            players = (f"x{i}", f"o{i}")
+            game_id = manager.create_game(*players)
+            cells = [(r, c) for r in range(3) for c in range(3)]
+            rnd.shuffle(cells)
+            for turn, (row, col) in enumerate(cells):
+                manager.make_move(game_id, players[turn % 2], row, col)
+            manager.make_move(game_id, players[0], 0, 0)
+            manager.get_game(game_id)
+            manager.delete_game(game_id)
+        return time.perf_counter() - start
+
+    print("=" * 50)
+    print("Metrics - Overhead")
+    print("=" * 50)
+    num_games = 10000
+    configs = [("off", lambda: None), ("every call", Metrics),
+               ("sampled 1/64", lambda: Metrics(sample_every=64))]
+    # Interleave the configurations so drift and heap state hit them alike
+    timings = {name: float('inf') for name, _ in configs}
+    for round_number in range(8):
+        for name, make in configs[round_number % 3:] + configs[:round_number % 3]:
+            seconds = workload(GameManager(metrics=make()), num_games, 1)
+            timings[name] = min(timings[name], seconds)
+    for name, seconds in timings.items():
+        print(f"metrics {name:13s} {seconds:.3f}s ({seconds / timings['off'] - 1:+.1%})")
+
+    print("\n--- Snapshot ---")
+    metrics = Metrics(sample_every=7)
+    metrics.add_exporter(JsonLinesExporter())
+    workload(GameManager(metrics=metrics), 1000, 2)
+    metrics.export()
+    operations = metrics.snapshot()['operations']
+    print(f"Counts exact when sampled: {operations == {op: 1000 * n for op, n in zip(OPERATIONS, (1, 1, 10, 1))}}")
+    print("\n" + "=" * 50)
@@ -0,0 +1,525 @@
+"""
+Append-only move log with crash recovery for GameManager
+
+This module includes:
+- MoveLog class, a segmented binary write-ahead log with group commit
+- DurableGameManager class that logs every accepted operation and can
+  rebuild its games from the log after a restart
+
+Record layout (little-endian):
+    u32 payload length | u32 crc32(type + payload) | u8 type | payload
+Payloads:
+    CREATE:  game_id, player1_id, player2_id
+    MOVE:    game_id, u16 row, u16 col
+    DELETE:  game_id (also written when a game is evicted)
+    FORFEIT: game_id (the player to move ran out of time)
+Strings are u16 length-prefixed UTF-8. A MOVE does not store the player:
+only accepted moves are logged, so the mover is whoever's turn it is.
+
+Durability: records are buffered and written + fsynced together once
+sync_bytes are pending or sync_interval seconds have passed since the
+last sync (group commit), so one fsync covers many moves. A background
+flusher thread commits whatever is still pending sync_interval after it
+was buffered, so records are not left unsynced once traffic stops. At
+most the last sync_interval (plus one fsync) of acknowledged moves can
+be lost in a crash; call sync() to close that window explicitly.
+
+Recovery mmap-scans the segments in order. A torn or corrupt record
+ends its segment only: appends after a restart always go to a fresh
+segment, so later segments still hold acknowledged records.
+Compaction writes its snapshot to a temporary file and renames it into
+place only once it is complete and fsynced.
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from solution import GameManager, GameStatus
+
+
+RECORD_CREATE = 1
+RECORD_MOVE = 2
+RECORD_DELETE = 3
+RECORD_FORFEIT = 4
+
+_HEADER = struct.Struct('<IIB')
+_U16 = struct.Struct('<H')
+_CELL = struct.Struct('<HH')
+
+_SEGMENT_PREFIX = 'segment-'
+_SEGMENT_SUFFIX = '.log'
+_TEMP_SUFFIX = '.tmp'  # a compacted segment before it is renamed into place
+
+
+def _encode_str(value: str) -> bytes:
+    """Encode a u16 length-prefixed UTF-8 string"""
+    data = value.encode()
+    return _U16.pack(len(data)) + data
+
+
+def _decode_str(buf, offset: int) -> Tuple[str, int]:
+    """Decode a u16 length-prefixed string, returning it and the next offset"""
+    (length,) = _U16.unpack_from(buf, offset)
+    start = offset + _U16.size
+    return buf[start:start + length].decode(), start + length
+
+
+class MoveLog:
+    """Segmented append-only log of game operations"""
+
+    def __init__(self, directory: str, segment_bytes: int = 64 << 20,
+                 sync_bytes: int = 1 << 20, sync_interval: float = 0.005,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Open a log directory for appending
+
+        Appends always go to a new segment, so a torn tail left by a crash
+        is never written after, and a temporary file left by an
+        interrupted compaction is removed. Starts the background flusher;
+        call close() when done.
+
+        Args:
+            directory: Directory holding the segment files (created if missing)
+            segment_bytes: Roll to a new segment after this many bytes
+            sync_bytes: Group-commit once this many bytes are pending
+            sync_interval: Group-commit once this many seconds have passed;
+                the flusher also commits pending records this long after
+                the first of them was buffered
+            clock: Time source in seconds (the flusher itself sleeps in
+                real time)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.sync_bytes = sync_bytes
+        self.sync_interval = sync_interval
+        self.clock = clock
+        self.pending = bytearray()
+        self.last_sync = clock()
+        self.fd = None
+        self.segment_size = 0
+        for name in os.listdir(directory):
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_TEMP_SUFFIX):
+                os.remove(os.path.join(directory, name))  # left by an interrupted compaction
+        existing = self.segments()
+        self.next_segment = self._segment_number(existing[-1]) + 1 if existing else 1
+        self._open_segment()
+        # Appends, syncs and segment switches all hold this lock
+        self.lock = threading.RLock()
+        self.pending_since = None  # clock() when the oldest pending record was buffered
+        self.flush_wakeup = threading.Condition(self.lock)
+        self.closed = False
+        self.flusher = threading.Thread(target=self._flush_loop, name='move-log-flusher',
+                                        daemon=True)
+        self.flusher.start()
+
+    def segments(self) -> List[str]:
+        """
+        List segment paths in log order
+
+        Returns:
+            Sorted list of segment file paths
+        """
+        names = [name for name in os.listdir(self.directory)
+                 if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX)]
+        return [os.path.join(self.directory, name)
+                for name in sorted(names, key=self._segment_number)]
+
+    def append_create(self, game_id: str, player1_id: str, player2_id: str):
+        """Log a created game"""
+        self._append(RECORD_CREATE, self._encode(RECORD_CREATE, (game_id, player1_id, player2_id)))
+
+    def append_move(self, game_id: str, row: int, col: int):
+        """Log an accepted move"""
+        self._append(RECORD_MOVE, self._encode(RECORD_MOVE, (game_id, row, col)))
+
+    def append_delete(self, game_id: str):
+        """Log a deleted game"""
+        self._append(RECORD_DELETE, self._encode(RECORD_DELETE, (game_id,)))
+
+    def append_forfeit(self, game_id: str):
+        """Log a game forfeited on time"""
+        self._append(RECORD_FORFEIT, self._encode(RECORD_FORFEIT, (game_id,)))
+
+    def sync(self):
+        """Write and fsync all pending records"""
+        with self.lock:
+            if self.pending:
+                self._write_all(self.fd, self.pending)
+                os.fsync(self.fd)
+                self.segment_size += len(self.pending)
+                self.pending.clear()
+                if self.segment_size >= self.segment_bytes:
+                    self._open_segment()
+            self.pending_since = None
+            self.last_sync = self.clock()
+
+    def close(self):
+        """Stop the flusher, sync pending records and close the current segment"""
+        with self.lock:
+            self.closed = True
+            self.flush_wakeup.notify()
+        self.flusher.join()
+        with self.lock:
+            self.sync()
+            os.close(self.fd)
+            self.fd = None
+
+    def scan(self) -> Iterator[Tuple[int, tuple]]:
+        """
+        Read every intact record in log order
+
+        A truncated or corrupt record ends its segment (it can only be the
+        torn tail of a crash); reading resumes with the next segment.
+
+        Yields:
+            (record type, fields) tuples
+        """
+        for path in self.segments():
+            if os.path.getsize(path) == 0:
+                continue
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                end = len(buf)
+                offset = 0
+                while offset + _HEADER.size <= end:
+                    length, crc, record_type = _HEADER.unpack_from(buf, offset)
+                    start = offset + _HEADER.size
+                    if start + length > end or zlib.crc32(
+                            buf[start - 1:start + length]) != crc:
+                        break
+                    yield record_type, self._decode(record_type, buf, start)
+                    offset = start + length
+
+    def rewrite(self, records: Iterator[Tuple[int, tuple]]):
+        """
+        Replace the log with the given records (used by compaction)
+
+        The records are written to a temporary file and fsynced, then
+        renamed into place as a segment after all the old ones, and only
+        then are the old segments removed. A compaction that fails or
+        crashes before the rename leaves just the temporary file, which
+        scan() ignores; one that crashes after it leaves the old segments
+        followed by a complete snapshot, whose CREATEs replace each game
+        with the same moves.
+
+        Args:
+            records: (record type, fields) tuples to keep
+        """
+        with self.lock:
+            self.sync()
+            old_segments = self.segments()
+            path = self._segment_path(self.next_segment)
+            temp_path = path + _TEMP_SUFFIX
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                buf = bytearray()
+                for record_type, fields in records:
+                    buf += self._frame(record_type, self._encode(record_type, fields))
+                    if len(buf) >= self.sync_bytes:
+                        self._write_all(fd, buf)
+                        buf.clear()
+                self._write_all(fd, buf)
+                os.fsync(fd)
+            except BaseException:
+                os.close(fd)
+                os.remove(temp_path)
+                raise
+            os.close(fd)
+            os.rename(temp_path, path)
+            self.next_segment += 1
+            self._open_segment()  # also fsyncs the directory, persisting the rename
+            for old_path in old_segments:
+                os.remove(old_path)
+            self._fsync_directory()
+
+    def _append(self, record_type: int, payload: bytes):
+        """Buffer one record and group-commit if due"""
+        record = self._frame(record_type, payload)
+        with self.lock:
+            pending = self.pending
+            pending += record
+            if (len(pending) >= self.sync_bytes
+                    or self.clock() - self.last_sync >= self.sync_interval):
+                self.sync()
+            elif self.pending_since is None:
+                self.pending_since = self.clock()
+                self.flush_wakeup.notify()
+
+    def _flush_loop(self):
+        """Background thread: commit records left pending for sync_interval"""
+        with self.lock:
+            while not self.closed:
+                if self.pending_since is None:
+                    self.flush_wakeup.wait()
+                    continue
+                remaining = self.pending_since + self.sync_interval - self.clock()
+                if remaining > 0:
+                    self.flush_wakeup.wait(remaining)
+                else:
+                    self.sync()
+
+    def _open_segment(self):
+        """Close the current segment (if any) and start the next one"""
+        if self.fd is not None:
+            os.close(self.fd)
+        self.fd = os.open(self._segment_path(self.next_segment),
+                          os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self.next_segment += 1
+        self.segment_size = 0
+        self._fsync_directory()
+
+    def _fsync_directory(self):
+        """Persist segment creation/removal in the directory entry"""
+        dir_fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _segment_path(self, number: int) -> str:
+        """Path of the segment with a given sequence number"""
+        return os.path.join(self.directory, f"{_SEGMENT_PREFIX}{number:08d}{_SEGMENT_SUFFIX}")
+
+    @staticmethod
+    def _write_all(fd: int, data):
+        """Write all of data, retrying after short writes"""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+    @staticmethod
+    def _frame(record_type: int, payload: bytes) -> bytes:
+        """Prefix a payload with its record header"""
+        crc = zlib.crc32(payload, zlib.crc32(bytes((record_type,))))
+        return _HEADER.pack(len(payload), crc, record_type) + payload
+
+    @staticmethod
+    def _encode(record_type: int, fields: tuple) -> bytes:
+        """Encode the fields of one record payload"""
+        payload = _encode_str(fields[0])
+        if record_type == RECORD_MOVE:
+            return payload + _CELL.pack(fields[1], fields[2])
+        if record_type == RECORD_CREATE:
+            return payload + _encode_str(fields[1]) + _encode_str(fields[2])
+        return payload
+
+    @staticmethod
+    def _segment_number(path: str) -> int:
+        """Extract the sequence number from a segment path"""
+        name = os.path.basename(path)
+        return int(name[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)])
+
+    @staticmethod
+    def _decode(record_type: int, buf, offset: int) -> tuple:
+        """Decode the fields of one record payload"""
+        game_id, offset = _decode_str(buf, offset)
+        if record_type == RECORD_MOVE:
+            return (game_id,) + _CELL.unpack_from(buf, offset)
+        if record_type == RECORD_CREATE:
+            player1_id, offset = _decode_str(buf, offset)
+            player2_id, _ = _decode_str(buf, offset)
+            return game_id, player1_id, player2_id
+        return (game_id,)
+
+
+class DurableGameManager(GameManager):
+    """
+    GameManager that logs every accepted operation to a MoveLog
+
+    Besides creates, moves and deletes, evictions are logged as deletes
+    and move-timeout forfeits as FORFEIT records, so recover() does not
+    bring those games back.
+    """
+
+    def __init__(self, log: MoveLog, **kwargs):
+        """
+        Initialize the game manager
+
+        Args:
+            log: Open MoveLog to append to
+            **kwargs: Passed through to GameManager
+        """
+        super().__init__(**kwargs)
+        self.log = log
+
+    @classmethod
+    def recover(cls, directory: str, keep_finished: bool = False,
+                log_options: Optional[dict] = None, **kwargs) -> 'DurableGameManager':
+        """
+        Rebuild a manager from the log in a directory
+
+        Args:
+            directory: Log directory
+            keep_finished: Also keep games that had already finished
+            log_options: Extra MoveLog arguments (segment_bytes, sync_interval, ...)
+            **kwargs: Passed through to GameManager
+
+        Returns:
+            DurableGameManager holding the recovered games
+        """
+        log = MoveLog(directory, **(log_options or {}))
+        manager = cls(log, **kwargs)
+        games = manager.games
+        # Replay through the GameManager methods (not the logging overrides)
+        # so the player index and finish bookkeeping stay consistent
+        for record_type, fields in log.scan():
+            if record_type == RECORD_MOVE:
+                game = games.get(fields[0])
+                if game is not None:
+                    manager._make_move(fields[0], game.current_player.player_id,
+                                       fields[1], fields[2])
+            elif record_type == RECORD_CREATE:
+                GameManager.delete_game(manager, fields[0])  # a CREATE replaces the game
+                GameManager.create_game(manager, fields[1], fields[2], fields[0])
+            elif record_type == RECORD_FORFEIT:
+                GameManager._on_move_timeout(manager, fields[0])
+            else:
+                GameManager.delete_game(manager, fields[0])
+        if not keep_finished:
+            for game_id in [gid for gid, game in games.items()
+                            if game.status != GameStatus.IN_PROGRESS]:
+                GameManager.delete_game(manager, game_id)
+        return manager
+
+    def create_game(self, player1_id: str, player2_id: str,
+                    game_id: Optional[str] = None) -> str:
+        """
+        Create and log a new game
+
+        Args:
+            player1_id: ID of first player (will be X)
+            player2_id: ID of second player (will be O)
+            game_id: Game ID to use (default: generated by Game)
+
+        Returns:
+            Game ID
+        """
+        game_id = super().create_game(player1_id, player2_id, game_id)
+        self.log.append_create(game_id, player1_id, player2_id)
+        return game_id
+
+    def make_move(self, game_id: str, player_id: str, row: int, col: int) -> str:
+        """
+        Make a move and log it if accepted
+
+        Args:
+            game_id: Game ID
+            player_id: Player ID
+            row: Row index
+            col: Column index
+
+        Returns:
+            Status message
+        """
+        result = super().make_move(game_id, player_id, row, col)
+        if result == 'SUCCESS':
+            self.log.append_move(game_id, row, col)
+        return result
+
+    def delete_game(self, game_id: str) -> bool:
+        """
+        Delete a game and log the deletion
+
+        Args:
+            game_id: Game ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        deleted = super().delete_game(game_id)
+        if deleted:
+            self.log.append_delete(game_id)
+        return deleted
+
+    def _evict(self, game_id: str, reason: str):
+        """Evict a game and log it as deleted"""
+        super()._evict(game_id, reason)
+        self.log.append_delete(game_id)
+
+    def _on_move_timeout(self, game_id: str):
+        """Forfeit a game whose move timer fired and log the forfeit"""
+        game = self.games.get(game_id)
+        if game is None or game.status != GameStatus.IN_PROGRESS:
+            return
+        super()._on_move_timeout(game_id)
+        self.log.append_forfeit(game_id)
+
+    def compact(self):
+        """Rewrite the log keeping only the games still in progress"""
+        self.log.rewrite(self._live_records())
+
+    def _live_records(self) -> Iterator[Tuple[int, tuple]]:
+        """Records recreating every in-progress game"""
+        for game_id, game in list(self.games.items()):
+            if game.status != GameStatus.IN_PROGRESS:
+                continue
+            yield RECORD_CREATE, (game_id, game.player1.player_id, game.player2.player_id)
+            for move in game.get_moves_history():
+                yield RECORD_MOVE, (game_id, move['row'], move['col'])
+
+
+# Example usage: crash recovery, throughput and compaction
+if __name__ == "__main__":
+    import random
+    import tempfile
+
+    print("=" * 50)
+    print("Move Log - Crash Recovery")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = DurableGameManager(MoveLog(directory))
+        rnd = random.Random(3)
+        num_games = 20000
+        start = time.perf_counter()
+        for i in range(num_games):
+            players = (f"x{i}", f"o{i}")
+            game_id = manager.create_game(*players)
+            cells = [(r, c) for r in range(3) for c in range(3)]
+            rnd.shuffle(cells)
+            for turn, (row, col) in enumerate(cells[:rnd.randrange(1, 10)]):
+                manager.make_move(game_id, players[turn % 2], row, col)
+            if i % 10 == 0:
+                manager.delete_game(game_id)
+        manager.log.sync()
+        elapsed = time.perf_counter() - start
+        size = sum(os.path.getsize(path) for path in manager.log.segments())
+        print(f"Logged {num_games} games in {elapsed:.2f}s ({size / 1e6:.1f} MB)")
+
+        # Simulate a crash: a torn record at the tail of the log
+        with open(manager.log.segments()[-1], 'ab') as f:
+            f.write(b'\x10\x00\x00')
+
+        start = time.perf_counter()
+        recovered = DurableGameManager.recover(directory)
+        elapsed = time.perf_counter() - start
+        live = {gid: g for gid, g in manager.games.items()
+                if g.status == GameStatus.IN_PROGRESS}
+        same = all(recovered.games[gid].get_board_state() == g.get_board_state()
+                   for gid, g in live.items())
+        print(f"Recovered {len(recovered.games)} in-progress games in {elapsed:.2f}s "
+              f"(expected {len(live)}, boards match: {same})")
+
+        # Games started after the restart land in a segment after the torn one
+        game_id = recovered.create_game("late-x", "late-o")
+        recovered.make_move(game_id, "late-x", 1, 1)
+        recovered.log.close()
+        recovered = DurableGameManager.recover(directory)
+        print(f"Second restart: {len(recovered.games)} games "
+              f"(expected {len(live) + 1}, new game kept: {game_id in recovered.games})")
+
+        recovered.compact()
+        size = sum(os.path.getsize(path) for path in recovered.log.segments())
+        print(f"After compaction: {len(recovered.log.segments())} segment(s), "
+              f"{size / 1e6:.2f} MB")
+        recovered.log.close()
+        again = DurableGameManager.recover(directory)
+        print(f"Recovered after compaction: {len(again.games)} games")
+        again.log.close()
+
+    print("\n" + "=" * 50)
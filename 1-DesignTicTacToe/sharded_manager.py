@@ -0,0 +1,259 @@
+"""
+Multi-process sharded GameManager
+
+This module includes:
+- ShardedGameManager class that partitions games across worker processes
+
+Each of the M workers owns a plain GameManager. Requests are routed by a
+stable hash of game_id (crc32, so routing survives restarts), and
+execute_batch() sends one message per shard per batch so pipe and
+pickling overhead is paid per batch, not per move. Workers run in
+parallel, so move throughput grows with the number of cores instead of
+being capped by one interpreter's GIL.
+
+Game IDs are generated in the parent so a game can be routed before it
+exists; get_game() returns a snapshot copy of the worker's Game.
+
+An operation that raises inside a worker does not take the shard down:
+the worker sends back a ShardError for that operation and carries on.
+"""
+
+import multiprocessing
+import os
+import uuid
+import zlib
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from solution import Board, Game, GameManager
+
+
+class ShardError(Exception):
+    """An operation raised inside a shard worker"""
+
+
+def _apply(handlers: dict, op: Tuple[Any, ...]) -> Any:
+    """Run one operation, turning any exception into a ShardError result"""
+    try:
+        return handlers[op[0]](*op[1:])
+    except Exception as exc:
+        # Sent as text: the original exception may not be picklable
+        return ShardError(f"{op[0]} failed: {exc!r}")
+
+
+def _shard_worker(conn, board_factory: Callable[[], object]):
+    """Worker process loop: apply batches of operations to a local GameManager"""
+    manager = GameManager(board_factory=board_factory)
+    handlers = {
+        'create': lambda p1, p2, game_id: manager.create_game(p1, p2, game_id),
+        'move': manager.make_move,
+        'get': manager.get_game,
+        'delete': manager.delete_game,
+    }
+    while True:
+        batch = conn.recv()
+        if batch is None:
+            break
+        conn.send([_apply(handlers, op) for op in batch])
+    conn.close()
+
+
+class ShardedGameManager:
+    """Routes GameManager operations to M worker processes by game_id"""
+
+    def __init__(self, num_shards: Optional[int] = None,
+                 board_factory: Callable[[], object] = Board):
+        """
+        Start the worker processes
+
+        Args:
+            num_shards: Number of worker processes (default: CPU count)
+            board_factory: Picklable callable returning a fresh board
+                (a class or functools.partial, not a lambda)
+        """
+        self.num_shards = num_shards or os.cpu_count() or 1
+        self.connections = []
+        self.processes = []
+        for _ in range(self.num_shards):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_shard_worker,
+                                              args=(child_conn, board_factory),
+                                              daemon=True)
+            process.start()
+            child_conn.close()
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+
+    def shard_for(self, game_id: str) -> int:
+        """
+        Get the shard owning a game
+
+        Args:
+            game_id: Game ID
+
+        Returns:
+            Shard index (0 to num_shards-1)
+        """
+        return zlib.crc32(game_id.encode()) % self.num_shards
+
+    def execute_batch(self, ops: Sequence[Tuple[Any, ...]]) -> List[Any]:
+        """
+        Execute many operations with one round trip per shard
+
+        Operations are tuples whose first element names the GameManager
+        method: ('create', player1_id, player2_id, game_id),
+        ('move', game_id, player_id, row, col), ('get', game_id) or
+        ('delete', game_id). Operations on the same game run in the
+        order given.
+
+        Args:
+            ops: Operations to execute
+
+        Returns:
+            Results in the same order as ops; an operation that raised in
+            its worker has a ShardError in its place
+        """
+        per_shard: List[List[Tuple[Any, ...]]] = [[] for _ in range(self.num_shards)]
+        positions: List[List[int]] = [[] for _ in range(self.num_shards)]
+        for index, op in enumerate(ops):
+            shard = self.shard_for(op[1] if op[0] != 'create' else op[3])
+            per_shard[shard].append(op)
+            positions[shard].append(index)
+
+        # Send everything first so shards work in parallel, then collect
+        for shard, batch in enumerate(per_shard):
+            if batch:
+                self.connections[shard].send(batch)
+        results: List[Any] = [None] * len(ops)
+        for shard, batch in enumerate(per_shard):
+            if batch:
+                for index, result in zip(positions[shard], self.connections[shard].recv()):
+                    results[index] = result
+        return results
+
+    def _execute_one(self, op: Tuple[Any, ...]) -> Any:
+        """Execute a single operation, raising its ShardError if it failed"""
+        result = self.execute_batch([op])[0]
+        if isinstance(result, ShardError):
+            raise result
+        return result
+
+    def create_game(self, player1_id: str, player2_id: str) -> str:
+        """
+        Create a new game on the shard its ID hashes to
+
+        Args:
+            player1_id: ID of first player (will be X)
+            player2_id: ID of second player (will be O)
+
+        Returns:
+            Game ID
+        """
+        game_id = str(uuid.uuid4())
+        return self._execute_one(('create', player1_id, player2_id, game_id))
+
+    def get_game(self, game_id: str) -> Optional[Game]:
+        """
+        Get a snapshot copy of a game
+
+        Args:
+            game_id: Game ID
+
+        Returns:
+            Copy of the Game or None if not found
+        """
+        return self._execute_one(('get', game_id))
+
+    def make_move(self, game_id: str, player_id: str, row: int, col: int) -> str:
+        """
+        Make a move in a specific game
+
+        Args:
+            game_id: Game ID
+            player_id: Player ID
+            row: Row index
+            col: Column index
+
+        Returns:
+            Status message
+        """
+        return self._execute_one(('move', game_id, player_id, row, col))
+
+    def delete_game(self, game_id: str) -> bool:
+        """
+        Delete a game
+
+        Args:
+            game_id: Game ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        return self._execute_one(('delete', game_id))
+
+    def close(self):
+        """Stop all worker processes"""
+        for conn in self.connections:
+            conn.send(None)
+            conn.close()
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
+
+    def __enter__(self) -> 'ShardedGameManager':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Benchmark: single-process GameManager vs ShardedGameManager
+if __name__ == "__main__":
+    import random
+    import time
+
+    num_games = 20000
+    size = 3
+
+    # Every game plays its cells in a random order; round t holds move t of each game
+    rnd = random.Random(7)
+    orders = []
+    for _ in range(num_games):
+        cells = [(r, c) for r in range(size) for c in range(size)]
+        rnd.shuffle(cells)
+        orders.append(cells)
+    game_ids = [str(uuid.uuid4()) for _ in range(num_games)]
+    rounds = [
+        [('move', game_ids[g], f"p{g}{'xo'[t % 2]}", *orders[g][t]) for g in range(num_games)]
+        for t in range(size * size)
+    ]
+    total_moves = num_games * size * size
+
+    print("=" * 50)
+    print("ShardedGameManager - Throughput Benchmark")
+    print("=" * 50)
+    print(f"CPUs available: {os.cpu_count()}")
+
+    manager = GameManager()
+    for g, game_id in enumerate(game_ids):
+        manager.create_game(f"p{g}x", f"p{g}o", game_id)
+    start = time.perf_counter()
+    for ops in rounds:
+        for _, game_id, player_id, row, col in ops:
+            manager.make_move(game_id, player_id, row, col)
+    elapsed = time.perf_counter() - start
+    print(f"GameManager:             {total_moves / elapsed:,.0f} moves/s")
+
+    for num_shards in (1, 2, 4, 8):
+        with ShardedGameManager(num_shards) as sharded:
+            sharded.execute_batch([('create', f"p{g}x", f"p{g}o", game_id)
+                                   for g, game_id in enumerate(game_ids)])
+            start = time.perf_counter()
+            for ops in rounds:
+                sharded.execute_batch(ops)
+            elapsed = time.perf_counter() - start
+            sample = sharded.get_game(game_ids[0])
+        print(f"Sharded ({num_shards} workers):    {total_moves / elapsed:,.0f} moves/s "
+              f"(game 0: {sample.get_game_status().value})")
+
+    print("\n" + "=" * 50)
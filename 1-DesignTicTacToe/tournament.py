@@ -0,0 +1,515 @@
+"""
+Self-play tournaments between move-selection strategies
+
+This module includes:
+- random_strategy, greedy_strategy and search_strategy
+- Standings class aggregating win/draw/loss matrices, scores and Elo
+- Tournament class scheduling round-robin or Swiss pairings on a
+  process pool
+
+A strategy is any callable strategy(game, rnd) -> (row, col) that picks
+a move for game.current_player; rnd is a random.Random seeded per game.
+Strategies must be picklable (module-level functions, or
+functools.partial over them) so they can be shipped to worker processes,
+and must leave the game as they found it. Every game is played through
+Game.make_move on a Board(size); a strategy that returns an illegal move
+loses that game.
+
+Work is cut into chunks of up to chunk_size games between one pairing,
+and a worker sends back only the chunk's totals. Chunks are folded into
+the standings as they finish (in whatever order), so memory depends on
+the number of strategies, not the number of games. Elo is fitted from
+the final matrix rather than updated game by game, so it does not
+depend on completion order. With a fixed seed every game gets the same
+random stream however the work is split, so results are reproducible
+(up to search_strategy's time budget).
+
+Usage:
+    python tournament.py --strategies random greedy search --games 200
+    python tournament.py --mode swiss --size 10 --workers 4 --jsonl chunks.jsonl
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from ai import best_move
+from solution import Board, Game, GameStatus, Player
+
+
+Strategy = Callable[[Game, random.Random], Tuple[int, int]]
+
+WINS = (GameStatus.X_WON, GameStatus.O_WON)
+
+
+def random_strategy(game: Game, rnd: random.Random) -> Tuple[int, int]:
+    """
+    Play a uniformly random empty cell
+
+    Cells are sampled until an empty one turns up, so a move costs O(1)
+    on average until the board is nearly full; after 32 misses the empty
+    cells are listed instead.
+    """
+    board = game.board
+    size = board.size
+    for _ in range(32):
+        row, col = rnd.randrange(size), rnd.randrange(size)
+        if board.is_valid_move(row, col):
+            return row, col
+    return rnd.choice([(row, col) for row in range(size) for col in range(size)
+                       if board.is_valid_move(row, col)])
+
+
+def _line_cells(size: int, row: int, col: int) -> Iterator[Tuple[int, int]]:
+    """Cells on the row, column and diagonals through (row, col)"""
+    for i in range(size):
+        yield row, i
+        yield i, col
+    if row == col:
+        for i in range(size):
+            yield i, i
+    if row + col == size - 1:
+        for i in range(size):
+            yield i, size - 1 - i
+
+
+def greedy_strategy(game: Game, rnd: random.Random) -> Tuple[int, int]:
+    """
+    Complete a line if possible, else block one, else play randomly
+
+    Only lines through each side's last move can have just changed, so
+    candidates are probed there with apply_move/undo_move: O(size) per
+    move on any board size. (A second, older threat of the opponent's is
+    not seen, but that position is lost anyway.)
+    """
+    board = game.board
+    history = game.moves_history
+    symbol = game.current_player.symbol
+    other = 'O' if symbol == 'X' else 'X'
+    # Our last move (a win for us), then theirs (a win to block)
+    for back, mover in ((2, symbol), (1, other)):
+        if len(history) < back:
+            continue
+        last = history[-back]
+        for row, col in _line_cells(board.size, last['row'], last['col']):
+            if board.is_valid_move(row, col):
+                outcome = board.apply_move(row, col, mover)
+                board.undo_move(row, col)
+                if outcome in WINS:
+                    return row, col
+    return random_strategy(game, rnd)
+
+
+def search_strategy(game: Game, rnd: random.Random, time_budget: float = 0.05) -> Tuple[int, int]:
+    """
+    Play ai.best_move within a time budget
+
+    3x3 is solved exactly; larger boards get the best move found by
+    iterative deepening. Use functools.partial to change the budget.
+    """
+    return best_move(game, time_budget)
+
+
+STRATEGIES: Dict[str, Strategy] = {
+    'random': random_strategy,
+    'greedy': greedy_strategy,
+    'search': search_strategy,
+}
+
+
+class ChunkResult(NamedTuple):
+    """Totals for one chunk of games between two strategies"""
+    round: int
+    first: int  # strategy index; plays X in even-numbered games
+    second: int
+    first_wins: int
+    draws: int
+    second_wins: int
+    first_illegal: int  # losses by returning an illegal move
+    second_illegal: int
+    moves: int
+    seconds: float  # worker time spent on the chunk
+
+
+# Per-process state, set by _init_worker
+_worker_strategies: Sequence[Strategy] = ()
+_worker_size = 3
+
+
+def _init_worker(strategies: Sequence[Strategy], size: int):
+    """Receive the strategies once per worker instead of once per chunk"""
+    global _worker_strategies, _worker_size
+    _worker_strategies = strategies
+    _worker_size = size
+
+
+def _play_chunk(task: Tuple[int, int, int, int, int, int]) -> ChunkResult:
+    """
+    Play games start..start+count-1 between two strategies
+
+    Game k is seeded from (seed, round, first, second, k), so results do
+    not depend on how games are split into chunks or across workers.
+    """
+    seed, round_number, first, second, start, count = task
+    strategies = (_worker_strategies[first], _worker_strategies[second])
+    began = time.perf_counter()
+    game = Game(Player('first', 'X'), Player('second', 'O'), Board(_worker_size), game_id='')
+    first_wins = draws = second_wins = first_illegal = second_illegal = moves = 0
+    for k in range(start, start + count):
+        rnd = random.Random(f"{seed}:{round_number}:{first}:{second}:{k}")
+        swap = k & 1  # odd games: second plays X
+        if k > start:
+            game.reset_game()
+        while game.status == GameStatus.IN_PROGRESS:
+            player = game.current_player
+            side = (player is game.player2) ^ swap  # 0 = first, 1 = second
+            move = strategies[side](game, rnd)
+            if move is None or game.make_move(player.player_id, *move) != 'SUCCESS':
+                if side:
+                    second_illegal += 1
+                    first_wins += 1
+                else:
+                    first_illegal += 1
+                    second_wins += 1
+                break
+        else:
+            if game.status == GameStatus.DRAW:
+                draws += 1
+            elif (game.status == GameStatus.X_WON) ^ swap:
+                first_wins += 1
+            else:
+                second_wins += 1
+        moves += len(game.moves_history)
+    return ChunkResult(round_number, first, second, first_wins, draws, second_wins,
+                       first_illegal, second_illegal, moves, time.perf_counter() - began)
+
+
+class Standings:
+    """Win/draw/loss matrices and ratings, built up one chunk at a time"""
+
+    def __init__(self, names: Sequence[str]):
+        """
+        Args:
+            names: Strategy names, in index order
+        """
+        n = len(names)
+        self.names = list(names)
+        self.wins = [[0] * n for _ in range(n)]  # wins[i][j]: i beat j
+        self.draws = [[0] * n for _ in range(n)]  # symmetric
+        self.illegal = [0] * n
+        self.byes = [0] * n  # Swiss rounds sat out, scored as wins
+        self.byes_points = [0.0] * n
+        self.games = 0
+        self.moves = 0
+        self.worker_seconds = 0.0
+
+    def add(self, chunk: ChunkResult):
+        """Fold one chunk's totals into the matrices"""
+        i, j = chunk.first, chunk.second
+        self.wins[i][j] += chunk.first_wins
+        self.wins[j][i] += chunk.second_wins
+        self.draws[i][j] += chunk.draws
+        self.draws[j][i] += chunk.draws
+        self.illegal[i] += chunk.first_illegal
+        self.illegal[j] += chunk.second_illegal
+        self.games += chunk.first_wins + chunk.draws + chunk.second_wins
+        self.moves += chunk.moves
+        self.worker_seconds += chunk.seconds
+
+    def add_bye(self, index: int, points: float):
+        """Credit a Swiss bye"""
+        self.byes[index] += 1
+        self.byes_points[index] += points
+
+    def played(self, i: int, j: int) -> int:
+        """Games played between strategies i and j"""
+        return self.wins[i][j] + self.draws[i][j] + self.wins[j][i]
+
+    def record(self, i: int) -> Tuple[int, int, int]:
+        """(wins, draws, losses) of strategy i over all opponents"""
+        n = len(self.names)
+        return (sum(self.wins[i]), sum(self.draws[i]),
+                sum(self.wins[j][i] for j in range(n)))
+
+    def score(self, i: int) -> float:
+        """Points of strategy i: 1 per win, 1/2 per draw, plus byes"""
+        wins, draws, _ = self.record(i)
+        return wins + draws / 2 + self.byes_points[i]
+
+    def elo(self, iterations: int = 500, anchor: float = 1500.0) -> List[float]:
+        """
+        Fit Elo ratings to the matrix
+
+        Bradley-Terry strengths by the MM algorithm, with a draw counted
+        as half a win each way. Every strategy also gets one virtual draw
+        against a strategy of average strength, so a perfect or winless
+        record still gets a finite rating. Ratings are shifted to average
+        `anchor`.
+
+        Returns:
+            One rating per strategy
+        """
+        n = len(self.names)
+        strength = [1.0] * n
+        points = [sum(self.wins[i]) + sum(self.draws[i]) / 2 + 0.5 for i in range(n)]
+        for _ in range(iterations):
+            updated = []
+            for i in range(n):
+                denominator = 1 / (strength[i] + 1)  # the virtual game
+                for j in range(n):
+                    games = self.played(i, j) if j != i else 0
+                    if games:
+                        denominator += games / (strength[i] + strength[j])
+                updated.append(points[i] / denominator)
+            # Keep the geometric mean at 1 so the virtual opponent stays average
+            scale = math.exp(-sum(math.log(s) for s in updated) / n)
+            change = max(abs(new * scale - old) / old for new, old in zip(updated, strength))
+            strength = [s * scale for s in updated]
+            if change < 1e-9:
+                break
+        ratings = [400 * math.log10(s) for s in strength]
+        shift = anchor - sum(ratings) / n
+        return [rating + shift for rating in ratings]
+
+    def report(self) -> dict:
+        """
+        Summarize the standings
+
+        Returns:
+            JSON-serializable dict with the matrices and a ranked table
+        """
+        ratings = self.elo()
+        table = []
+        for i, name in enumerate(self.names):
+            wins, draws, losses = self.record(i)
+            table.append({
+                'name': name,
+                'elo': round(ratings[i], 1),
+                'score': self.score(i),
+                'wins': wins,
+                'draws': draws,
+                'losses': losses,
+                'illegal': self.illegal[i],
+                'byes': self.byes[i],
+            })
+        table.sort(key=lambda row: (-row['elo'], row['name']))
+        return {
+            'games': self.games,
+            'moves': self.moves,
+            'worker_seconds': round(self.worker_seconds, 3),
+            'names': self.names,
+            'wins': self.wins,
+            'draws': self.draws,
+            'standings': table,
+        }
+
+
+class Tournament:
+    """Plays strategies against each other on a process pool"""
+
+    def __init__(self, strategies: Dict[str, Strategy], size: int = 3,
+                 games_per_pairing: int = 100, chunk_size: int = 50,
+                 workers: Optional[int] = None, seed: int = 0):
+        """
+        Configure a tournament
+
+        Args:
+            strategies: {name: strategy callable}; at least two
+            size: Board size, anything Board(size) supports
+            games_per_pairing: Games each pairing plays, colours alternating
+            chunk_size: Games per work unit sent to a worker
+            workers: Worker processes (default: CPU count; 0 plays inline)
+            seed: Seed for every game's random stream
+        """
+        if len(strategies) < 2:
+            raise ValueError("A tournament needs at least two strategies")
+        if games_per_pairing < 1 or chunk_size < 1:
+            raise ValueError("games_per_pairing and chunk_size must be positive")
+        self.names = list(strategies)
+        self.strategies = [strategies[name] for name in self.names]
+        self.size = size
+        self.games_per_pairing = games_per_pairing
+        self.chunk_size = chunk_size
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.seed = seed
+
+    def _tasks(self, round_number: int, pairings: Sequence[Tuple[int, int]]) -> List[tuple]:
+        """Cut each pairing's games into chunks"""
+        return [(self.seed, round_number, first, second, start,
+                 min(self.chunk_size, self.games_per_pairing - start))
+                for first, second in pairings
+                for start in range(0, self.games_per_pairing, self.chunk_size)]
+
+    def round_robin(self) -> List[Tuple[int, int]]:
+        """Every strategy against every other one"""
+        n = len(self.names)
+        return [(i, j) for i in range(n) for j in range(i + 1, n)]
+
+    def swiss_pairings(self, standings: Standings) -> Tuple[List[Tuple[int, int]], Optional[int]]:
+        """
+        Pair strategies with similar scores for the next Swiss round
+
+        Strategies are ranked by score (then Elo) and each takes the
+        highest-ranked opponent it has not met yet, or the next one if it
+        has met them all. With an odd count the lowest-ranked strategy
+        without a bye sits out.
+
+        Returns:
+            (pairings, index of the strategy with the bye or None)
+        """
+        ratings = standings.elo()
+        order = sorted(range(len(self.names)),
+                       key=lambda i: (-standings.score(i), -ratings[i], i))
+        bye = None
+        if len(order) % 2:
+            bye = min(reversed(order), key=lambda i: standings.byes[i])
+            order.remove(bye)
+        pairings = []
+        while order:
+            first = order.pop(0)
+            partner = next((j for j in order if not standings.played(first, j)), order[0])
+            order.remove(partner)
+            pairings.append((first, partner))
+        return pairings, bye
+
+    def results(self, mode: str = 'round_robin', rounds: Optional[int] = None,
+                standings: Optional[Standings] = None) -> Iterator[ChunkResult]:
+        """
+        Play the tournament, yielding each chunk's totals as it finishes
+
+        Args:
+            mode: 'round_robin' or 'swiss'
+            rounds: Swiss rounds (default: ceil(log2(strategies)))
+            standings: Standings to fold chunks into as they arrive
+                (needed by Swiss pairing; a new one is used if omitted)
+
+        Returns:
+            Iterator of ChunkResult in completion order
+        """
+        if mode not in ('round_robin', 'swiss'):
+            raise ValueError(f"Unknown tournament mode {mode!r}")
+        if standings is None:
+            standings = Standings(self.names)
+        if rounds is None:
+            rounds = max(1, math.ceil(math.log2(len(self.names))))
+        if self.workers > 0:
+            pool = multiprocessing.Pool(self.workers, _init_worker, (self.strategies, self.size))
+        else:
+            pool = None
+            _init_worker(self.strategies, self.size)
+        try:
+            for round_number in range(rounds if mode == 'swiss' else 1):
+                if mode == 'swiss':
+                    pairings, bye = self.swiss_pairings(standings)
+                    if bye is not None:
+                        standings.add_bye(bye, self.games_per_pairing)
+                else:
+                    pairings = self.round_robin()
+                tasks = self._tasks(round_number, pairings)
+                chunks = (pool.imap_unordered(_play_chunk, tasks) if pool is not None
+                          else map(_play_chunk, tasks))
+                for chunk in chunks:
+                    standings.add(chunk)
+                    yield chunk
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+    def run(self, mode: str = 'round_robin', rounds: Optional[int] = None,
+            on_chunk: Optional[Callable[[ChunkResult], None]] = None) -> Standings:
+        """
+        Play the whole tournament
+
+        Args:
+            mode: 'round_robin' or 'swiss'
+            rounds: Swiss rounds (default: ceil(log2(strategies)))
+            on_chunk: Called with each ChunkResult as it arrives
+
+        Returns:
+            Final Standings
+        """
+        standings = Standings(self.names)
+        for chunk in self.results(mode, rounds, standings):
+            if on_chunk is not None:
+                on_chunk(chunk)
+        return standings
+
+
+def format_standings(report: dict) -> str:
+    """Render a Standings.report() as a W/D/L matrix and a ranked table"""
+    names = report['names']
+    width = max(8, max(len(name) for name in names) + 1)
+    lines = ["W/D/L (row vs column)",
+             " " * width + "".join(f"{name:>{width + 6}}" for name in names)]
+    for i, name in enumerate(names):
+        cells = []
+        for j in range(len(names)):
+            if i == j:
+                cells.append(f"{'-':>{width + 6}}")
+            else:
+                wdl = f"{report['wins'][i][j]}/{report['draws'][i][j]}/{report['wins'][j][i]}"
+                cells.append(f"{wdl:>{width + 6}}")
+        lines.append(f"{name:<{width}}" + "".join(cells))
+    lines.append("")
+    lines.append(f"{'':<{width}}{'elo':>8}{'score':>9}{'W':>7}{'D':>7}{'L':>7}{'illegal':>9}")
+    for row in report['standings']:
+        lines.append(f"{row['name']:<{width}}{row['elo']:8.1f}{row['score']:9.1f}"
+                     f"{row['wins']:7}{row['draws']:7}{row['losses']:7}{row['illegal']:9}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe strategy tournament")
+    parser.add_argument('--strategies', nargs='+', choices=sorted(STRATEGIES),
+                        default=sorted(STRATEGIES))
+    parser.add_argument('--mode', choices=('round_robin', 'swiss'), default='round_robin')
+    parser.add_argument('--rounds', type=int, help="Swiss rounds")
+    parser.add_argument('--size', type=int, default=3)
+    parser.add_argument('--games', type=int, default=100, help="games per pairing")
+    parser.add_argument('--chunk', type=int, default=50, help="games per work unit")
+    parser.add_argument('--workers', type=int, help="worker processes (0 = inline)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--jsonl', help="append each chunk's totals here as it finishes")
+    parser.add_argument('--json', action='store_true', help="print the final report as JSON")
+    args = parser.parse_args()
+
+    if len(set(args.strategies)) < 2:
+        parser.error("need at least two different strategies")
+    tournament = Tournament({name: STRATEGIES[name] for name in dict.fromkeys(args.strategies)},
+                            args.size, args.games, args.chunk, args.workers, args.seed)
+    stream = open(args.jsonl, 'a') if args.jsonl else None
+    started = time.perf_counter()
+    try:
+        def on_chunk(chunk: ChunkResult):
+            if stream is not None:
+                stream.write(json.dumps(chunk._asdict()) + '\n')
+                stream.flush()
+        standings = tournament.run(args.mode, args.rounds, on_chunk)
+    finally:
+        if stream is not None:
+            stream.close()
+    elapsed = time.perf_counter() - started
+    report = standings.report()
+    report['elapsed_s'] = round(elapsed, 3)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print("=" * 50)
+    print(f"Tournament: {args.mode}, {args.size}x{args.size}, "
+          f"{tournament.workers} workers, seed {args.seed}")
+    print("=" * 50)
+    print(f"{report['games']:,} games, {report['moves']:,} moves in {elapsed:.2f}s "
+          f"({report['games'] / elapsed:,.0f} games/s)\n")
+    print(format_standings(report))
+    print("\n" + "=" * 50)
+
+
+if __name__ == "__main__":
+    main()